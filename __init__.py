@@ -1,9 +0,0 @@
-"""
-Core module containing the base classes and implementations for cluster chain dynamics.
-"""
-
-from .compact_object import CompactObject
-from .star_cluster import StarCluster
-from .self_propelling_mc import SelfPropellingMolecularCloud
-
-__all__ = ['CompactObject', 'StarCluster', 'SelfPropellingMolecularCloud']
\ No newline at end of file
@@ -16,7 +16,7 @@ def main():
         initial_velocity=initial_velocity,
         potential_func="MiyamotoNagai",
         feedback_func="pulsed_feedback",
-        feedback_params=dict(a_0=[np.array([0., 0., 1.]), -np.array([0., 0., 2.]),], 
+        feedback_params=dict(a_0=np.array([[0., 0.], [0., 0.], [1., -2.]]), 
                              t_pulse=np.array([20., 50.,]),
                              sigma_t= np.array([10., 20.,]),
                              )
@@ -8,7 +8,8 @@ from . import plotting
 
 from .forces import feedback, gravity
 
-from .simulations.calculate_path import single_object_solve
+from .simulations.calculate_path import single_object_solve, multi_object_solve, multi_object_solve_parallel, batch_solve, warm_up
+from .simulations.observe import observe_single_object
 
 from .plotting import plot_coord_vs_vel_2D
 
@@ -0,0 +1,29 @@
+"""
+Optional numba support. Without numba the decorators below leave functions as plain Python.
+"""
+
+from typing import Any, Callable
+
+try:
+    from numba import njit
+    from numba.extending import is_jitted
+    has_numba = True
+except ImportError:
+    has_numba = False
+
+    def njit(*args: Any, **kwargs: Any) -> Callable:
+        """
+        Stand-in for `numba.njit` returning the decorated function unchanged.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def is_jitted(func: Any) -> bool:
+        """
+        Stand-in for `numba.extending.is_jitted`, nothing is jitted without numba.
+        """
+        return False
+
+
+__all__ = ['njit', 'is_jitted', 'has_numba']
@@ -4,6 +4,6 @@ module containing feedback models.
 
 from .constant import constant_feedback
 from .linear_time import linear_feedback, linear_feedback_no_sign_flip
-from .pulsed_time import pulsed_feedback
+from .pulsed_time import pulsed_feedback, windowed_pulsed_feedback, sort_pulses
 
-__all__ = ['constant_feedback', 'linear_feedback', 'linear_feedback_no_sign_flip', 'pulsed_feedback']
\ No newline at end of file
+__all__ = ['constant_feedback', 'linear_feedback', 'linear_feedback_no_sign_flip', 'pulsed_feedback', 'windowed_pulsed_feedback']
\ No newline at end of file
@@ -1,5 +1,9 @@
 import numpy as np
 
+from ..._numba import njit
+
+
+@njit(cache=True)
 def constant_feedback(t:float, pos: np.ndarray, a_0: np.ndarray) -> np.ndarray:
     """
     Calculate the constant feedback force acting on an object.
@@ -18,4 +22,11 @@ def constant_feedback(t:float, pos: np.ndarray, a_0: np.ndarray) -> np.ndarray:
     np.ndarray
         The constant feedback force vector.
     """
-    return a_0
\ No newline at end of file
+    return a_0
+
+
+@njit(cache=True)
+def _add_constant_feedback(t: float, pos: np.ndarray, acc: np.ndarray, a_0: np.ndarray):
+    """Add `constant_feedback` to the acceleration acc of shape (3,) in place."""
+    for i in range(3):
+        acc[i] += a_0[i]
@@ -1,5 +1,9 @@
 import numpy as np
 
+from ..._numba import njit
+
+
+@njit(cache=True)
 def linear_feedback(t:float, pos: np.ndarray, a_0: np.ndarray, a_1: np.ndarray) -> np.ndarray:
     
     """ Calculate the linear feedback force acting on an object.        
@@ -22,6 +26,7 @@ def linear_feedback(t:float, pos: np.ndarray, a_0: np.ndarray, a_1: np.ndarray)
     return a_0 + a_1 * t
     
     
+@njit(cache=True)
 def linear_feedback_no_sign_flip(t:float, pos: np.ndarray, a_0: np.ndarray, a_1: np.ndarray) -> np.ndarray:
     
     """ Calculate the linear feedback force acting on an object, returning 0 in case of full  decellaration instead of a sign flip.      
@@ -44,5 +49,21 @@ def linear_feedback_no_sign_flip(t:float, pos: np.ndarray, a_0: np.ndarray, a_1:
     
     a = a_0 + a_1 * t
     
-    return a if np.sign(a) == np.sign(a_0) else 0.
-    
\ No newline at end of file
+    return np.where(np.sign(a) == np.sign(a_0), a, 0.)
+    
+
+
+@njit(cache=True)
+def _add_linear_feedback(t: float, pos: np.ndarray, acc: np.ndarray, a_0: np.ndarray, a_1: np.ndarray):
+    """Add `linear_feedback` to the acceleration acc of shape (3,) in place."""
+    for i in range(3):
+        acc[i] += a_0[i] + a_1[i] * t
+
+
+@njit(cache=True)
+def _add_linear_feedback_no_sign_flip(t: float, pos: np.ndarray, acc: np.ndarray, a_0: np.ndarray, a_1: np.ndarray):
+    """Add `linear_feedback_no_sign_flip` to the acceleration acc of shape (3,) in place."""
+    for i in range(3):
+        a = a_0[i] + a_1[i] * t
+        if np.sign(a) == np.sign(a_0[i]):
+            acc[i] += a
@@ -2,6 +2,11 @@
 module containing gravitational potential models.
 """
 
-from .squared import squared_potential_force
+from .squared import squared_potential_force, squared_potential_jac
+from .axisymmetric import axisymmetric_force
+from .miyamoto_nagai import miyamoto_nagai_force, miyamoto_nagai_jac
+from .nfw import nfw_force, nfw_jac
+from .hernquist import hernquist_force, hernquist_jac
 
-__all__ = ['squared_potential_force',]
\ No newline at end of file
+__all__ = ['squared_potential_force', 'squared_potential_jac', 'axisymmetric_force',
+           'miyamoto_nagai_force', 'miyamoto_nagai_jac', 'nfw_force', 'nfw_jac', 'hernquist_force', 'hernquist_jac',]
@@ -0,0 +1,44 @@
+from typing import Callable, Tuple
+from math import hypot
+import numpy as np
+
+
+def axisymmetric_force(Rzforce: Callable[[float, float], Tuple[float, float]]) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build the Cartesian acceleration of an axisymmetric potential from its cylindrical force components.
+
+    `Rzforce(R, z)` returns the radial and vertical accelerations (a_R, a_z) together, so quantities
+    shared by both (e.g. the enclosed mass of a spherical potential) are only computed once per call.
+    It receives floats for a single position and arrays for positions of shape (3, M).
+
+    Args:
+        Rzforce (Callable): Cylindrical accelerations, called as Rzforce(R, z) -> (a_R, a_z)
+
+    Returns:
+        Callable: Acceleration for positions of shape (3,) or (3, M). Single positions return a
+            reused array, so callers must consume the result before the next call.
+    """
+
+    out = np.empty(3)
+
+    def force(pos: np.ndarray) -> np.ndarray:
+        if pos.ndim == 1:
+            # Single position: scalar math on Python floats is much cheaper than on numpy scalars
+            x, y, z = pos.tolist()
+            R = hypot(x, y)
+            aR, az = Rzforce(R, z)
+            # aR vanishes on the axis, so the offset only guards against 0/0 at R = 0
+            aR_over_R = aR / (R + 1e-300)
+            out[0] = x * aR_over_R
+            out[1] = y * aR_over_R
+            out[2] = az
+            return out
+
+        # pos holds M positions as shape (3, M), evaluated in one vectorized call
+        x, y, z = pos
+        R = np.hypot(x, y)
+        aR, az = Rzforce(R, z)
+        aR_over_R = aR / (R + 1e-300)
+        return np.stack((x * aR_over_R, y * aR_over_R, az))
+
+    return force
@@ -1,6 +1,13 @@
-from typing import Any, Tuple, Callable
+from typing import Any, Callable, Dict, Optional, Tuple
+from math import hypot
 import numpy as np
 
+from ..._numba import has_numba
+from .axisymmetric import axisymmetric_force
+from .miyamoto_nagai import miyamoto_nagai_force
+from .nfw import nfw_force
+from .hernquist import hernquist_force
+
 try:
     import galpy.potential as galpo
     has_galpy = True
@@ -8,10 +15,99 @@ except ImportError:
     has_galpy = False
 
 
+# Jitted closed forms of the galpy potentials in internal units, with their parameters read from the
+# galpy instance. Galpy has no public accessor for the amplitude and the Miyamoto-Nagai scales, so
+# `_closed_form` checks each against galpy's public force methods before it is used.
+_CLOSED_FORMS = {
+    "MiyamotoNagai": (miyamoto_nagai_force, lambda potential: dict(amp=potential._amp, a=potential._a, b2=potential._b**2)),
+    "NFWPotential": (nfw_force, lambda potential: dict(amp=potential._amp, a=potential.a)),
+    "HernquistPotential": (hernquist_force, lambda potential: dict(amp=potential._amp, a=potential.a)),
+}
+
+# Positions of shape (3, M) at which shortcuts are checked against galpy's public methods, off and on the axis
+_CHECK_POSITIONS = np.array([[0.6, 0.3, 0.], [0.8, -0.4, 0.], [0.2, -1.5, 0.7]])
+
+
+def _closed_form(potential: Any, potential_type: str) -> Optional[Tuple[Callable, Dict[str, float]]]:
+    """
+    Jitted closed form of a galpy potential and its parameters, if it reproduces galpy.
+    
+    The forces are compared with galpy's public `Rforce` and `zforce`, so a galpy potential in
+    physical units, or a change of the galpy attributes the parameters are read from, falls back
+    to the galpy calls instead of integrating a different potential.
+    
+    Args:
+        potential (Any): Galpy potential instance
+        potential_type (str): Name of the galpy potential, a key of `_CLOSED_FORMS`
+    
+    Returns:
+        Optional[Tuple[Callable, Dict[str, float]]]: The model of `forces.gravity` and its parameters,
+            None if they do not match galpy
+    """
+    
+    func, get_params = _CLOSED_FORMS[potential_type]
+    try:
+        params = get_params(potential)
+    except AttributeError:
+        return None
+    
+    x, y, z = _CHECK_POSITIONS
+    R = np.hypot(x, y)
+    a_R = np.array([potential.Rforce(R_i, z_i) for R_i, z_i in zip(R, z)], dtype=float)
+    a_z = np.array([potential.zforce(R_i, z_i) for R_i, z_i in zip(R, z)], dtype=float)
+    R_safe = np.where(R > 0., R, 1.)
+    expected = np.stack((a_R * x / R_safe, a_R * y / R_safe, a_z))
+    if not np.allclose(func(_CHECK_POSITIONS, **params), expected, rtol=1e-10, atol=0.):
+        return None
+    
+    return func, params
+
+
+def _internal_units_methods(potential: Any) -> Optional[Tuple[Callable, ...]]:
+    """
+    Rforce, zforce, R2deriv, z2deriv and Rzderiv of a galpy potential without galpy's unit handling.
+    
+    In internal units the public methods only wrap amp * potential._Rforce etc. in unit handling
+    decorators, which cost several times the evaluation itself. These private members are checked
+    against the public methods, so a potential in physical units, or a change of galpy internals,
+    falls back to the public methods instead of changing the forces.
+    
+    Args:
+        potential (Any): Galpy potential instance
+    
+    Returns:
+        Optional[Tuple[Callable, ...]]: The five derivatives called as f(R, z), None if the private
+            members are missing or do not match the public methods
+    """
+    
+    names = ("Rforce", "zforce", "R2deriv", "z2deriv", "Rzderiv")
+    try:
+        amp = potential._amp
+        private = [getattr(potential, "_" + name) for name in names]
+    except AttributeError:
+        return None
+    methods = tuple((lambda R, z, _f=f: amp * _f(R, z)) for f in private)
+    
+    x, y, z = _CHECK_POSITIONS
+    R = np.hypot(x, y)
+    for method, name in zip(methods, names):
+        public = getattr(potential, name)
+        for R_i, z_i in zip(R, z):
+            if not np.isclose(method(R_i, z_i), public(R_i, z_i), rtol=1e-12, atol=0.):
+                return None
+    
+    return methods
+
+
 def _get_galpy_potential(potential_type: str) -> Any:
     """
     Retrieve a galpy potential object based on the specified type.
     
+    The returned callable carries the analytic position Jacobian of the acceleration as its
+    `jacobian` attribute, built from galpy's second derivatives of the potential. With numba and
+    internal units it also carries `closed_form`, a jitted model of `forces.gravity` with its
+    parameters as (func, params), which the solvers use in place of the galpy calls, see `_closed_form`.
+    
     Args:
         potential_type (str): Name of the galpy potential to retrieve
     
@@ -32,15 +128,38 @@ def _get_galpy_potential(potential_type: str) -> Any:
         return None
     
     potential = potential_map[potential_type]()
+    methods = _internal_units_methods(potential)
+    if methods is None:
+        # Physical units or unexpected galpy internals: the public methods convert inputs and outputs
+        methods = (potential.Rforce, potential.zforce, potential.R2deriv, potential.z2deriv, potential.Rzderiv)
+    Rforce, zforce, R2deriv, z2deriv, Rzderiv = methods
+    
+    potential_callable = axisymmetric_force(lambda R, z: (Rforce(R, z), zforce(R, z)))
+    
+    def potential_jacobian(pos: np.ndarray) -> np.ndarray:
+        # d a_i / d x_j = -d^2 Phi / dx_i dx_j, with the Cartesian Hessian assembled from the
+        # cylindrical derivatives Phi_RR, Phi_zz, Phi_Rz and Phi_R / R
+        x, y, z = pos.tolist()
+        R = hypot(x, y)
+        if R > 0.:
+            cos_phi, sin_phi = x / R, y / R
+            phi_R_over_R = -Rforce(R, z) / R
+        else:
+            # On the axis Phi_R / R tends to Phi_RR and the Hessian is the same in every azimuth
+            cos_phi, sin_phi = 1., 0.
+            phi_R_over_R = R2deriv(0., z)
+        phi_RR = R2deriv(R, z)
+        phi_Rz = Rzderiv(R, z)
+        return -np.array([
+            [phi_RR * cos_phi**2 + phi_R_over_R * sin_phi**2, (phi_RR - phi_R_over_R) * cos_phi * sin_phi, phi_Rz * cos_phi],
+            [(phi_RR - phi_R_over_R) * cos_phi * sin_phi, phi_RR * sin_phi**2 + phi_R_over_R * cos_phi**2, phi_Rz * sin_phi],
+            [phi_Rz * cos_phi, phi_Rz * sin_phi, z2deriv(R, z)],
+        ])
+    
+    potential_callable.jacobian = potential_jacobian
+    if has_numba:
+        closed_form = _closed_form(potential, potential_type)
+        if closed_form is not None:
+            potential_callable.closed_form = closed_form
     
-    def potential_callable(pos: np.ndarray) -> Tuple[float, float, float]:
-                # Calculate cylindrical radius
-        R = np.sqrt(pos[0]**2 + pos[1]**2)
-        # Gravitational acceleration from galpy potential
-        aR = potential.Rforce(R, pos[2])
-        az = potential.zforce(R, pos[2])
-        ax = aR * pos[0] / R if R > 0 else 0
-        ay = aR * pos[1] / R if R > 0 else 0
-        return ax, ay, az
-    
-    return  potential_callable
\ No newline at end of file
+    return  potential_callable
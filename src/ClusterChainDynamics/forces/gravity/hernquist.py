@@ -0,0 +1,29 @@
+import numpy as np
+
+from ..._numba import njit
+
+
+@njit(cache=True)
+def hernquist_force(pos: np.ndarray, amp: float, a: float):
+    """Hernquist force, Phi = -amp / (2 (a + r)) as in galpy, for positions of shape (3,) or (3, M)."""
+    r = np.sqrt(pos[0]**2 + pos[1]**2 + pos[2]**2)
+    # The offset only guards against 0/0 at the center, where the force direction is undefined
+    return - amp / (2. * (a + r)**2 * (r + 1e-300)) * pos
+
+
+@njit(cache=True)
+def hernquist_jac(pos: np.ndarray, amp: float, a: float):
+    """Jacobian of `hernquist_force` with respect to a position of shape (3,)."""
+    r = np.sqrt(pos[0]**2 + pos[1]**2 + pos[2]**2)
+    a_r_over_r = - amp / (2. * (a + r)**2 * r)
+    da_r_dr = amp / (a + r)**3
+    return (da_r_dr - a_r_over_r) / r**2 * np.outer(pos, pos) + a_r_over_r * np.eye(3)
+
+
+@njit(cache=True)
+def _add_hernquist_force(pos: np.ndarray, acc: np.ndarray, amp: float, a: float):
+    """Add `hernquist_force` for a single position of shape (3,) to acc in place, without temporaries."""
+    r = np.sqrt(pos[0]**2 + pos[1]**2 + pos[2]**2)
+    a_r_over_r = - amp / (2. * (a + r)**2 * (r + 1e-300))
+    for i in range(3):
+        acc[i] += a_r_over_r * pos[i]
@@ -0,0 +1,42 @@
+import numpy as np
+
+from ..._numba import njit
+
+
+@njit(cache=True)
+def miyamoto_nagai_force(pos: np.ndarray, amp: float, a: float, b2: float):
+    """
+    Miyamoto-Nagai disk force, Phi = -amp / sqrt(R^2 + (a + sqrt(z^2 + b^2))^2) as in galpy, for positions
+    of shape (3,) or (3, M).
+    """
+    s = np.sqrt(pos[2]**2 + b2)
+    c = amp / (pos[0]**2 + pos[1]**2 + (a + s)**2)**1.5
+    a_g = - c * pos
+    a_g[2] = a_g[2] * (a + s) / s
+    return a_g
+
+
+@njit(cache=True)
+def miyamoto_nagai_jac(pos: np.ndarray, amp: float, a: float, b2: float):
+    """Jacobian of `miyamoto_nagai_force` with respect to a position of shape (3,)."""
+    x, y, z = pos[0], pos[1], pos[2]
+    s = np.sqrt(z**2 + b2)
+    D = x**2 + y**2 + (a + s)**2
+    c = amp / D**1.5
+    # Gradient of D / 2
+    u = np.array([x, y, z * (a + s) / s])
+    jac = 3. * c / D * np.outer(u, u)
+    jac[0, 0] -= c
+    jac[1, 1] -= c
+    jac[2, 2] -= c * ((a + s) / s - a * z**2 / s**3)
+    return jac
+
+
+@njit(cache=True)
+def _add_miyamoto_nagai_force(pos: np.ndarray, acc: np.ndarray, amp: float, a: float, b2: float):
+    """Add `miyamoto_nagai_force` for a single position of shape (3,) to acc in place, without temporaries."""
+    s = np.sqrt(pos[2]**2 + b2)
+    c = amp / (pos[0]**2 + pos[1]**2 + (a + s)**2)**1.5
+    acc[0] -= c * pos[0]
+    acc[1] -= c * pos[1]
+    acc[2] -= c * pos[2] * (a + s) / s
@@ -0,0 +1,30 @@
+import numpy as np
+
+from ..._numba import njit
+
+
+@njit(cache=True)
+def nfw_force(pos: np.ndarray, amp: float, a: float):
+    """NFW halo force, Phi = -amp * ln(1 + r/a) / r as in galpy, for positions of shape (3,) or (3, M)."""
+    r = np.sqrt(pos[0]**2 + pos[1]**2 + pos[2]**2)
+    # The offset only guards against 0/0 at the center, where the force direction is undefined
+    return amp * (r / (a + r) - np.log1p(r / a)) / (r**3 + 1e-300) * pos
+
+
+@njit(cache=True)
+def nfw_jac(pos: np.ndarray, amp: float, a: float):
+    """Jacobian of `nfw_force` with respect to a position of shape (3,)."""
+    r = np.sqrt(pos[0]**2 + pos[1]**2 + pos[2]**2)
+    h = r / (a + r) - np.log1p(r / a)
+    a_r_over_r = amp * h / r**3
+    da_r_dr = - amp * (1. / (r * (a + r)**2) + 2. * h / r**3)
+    return (da_r_dr - a_r_over_r) / r**2 * np.outer(pos, pos) + a_r_over_r * np.eye(3)
+
+
+@njit(cache=True)
+def _add_nfw_force(pos: np.ndarray, acc: np.ndarray, amp: float, a: float):
+    """Add `nfw_force` for a single position of shape (3,) to acc in place, without temporaries."""
+    r = np.sqrt(pos[0]**2 + pos[1]**2 + pos[2]**2)
+    a_r_over_r = amp * (r / (a + r) - np.log1p(r / a)) / (r**3 + 1e-300)
+    for i in range(3):
+        acc[i] += a_r_over_r * pos[i]
@@ -1,7 +1,23 @@
 import numpy as np
 
+from ..._numba import njit
 
+
+@njit(cache=True)
 def squared_potential_force(pos: np.ndarray, a_0: np.ndarray):
-    """Defines a square potential well force field."""
-    a = - a_0 * pos
+    """Defines a square potential well force field, for positions of shape (3,) or (3, M)."""
+    a = - (a_0 * pos.T).T
     return a
+
+
+@njit(cache=True)
+def squared_potential_jac(pos: np.ndarray, a_0: np.ndarray):
+    """Jacobian of `squared_potential_force` with respect to position, a constant 3x3 matrix."""
+    return - np.diag(a_0)
+
+
+@njit(cache=True)
+def _add_squared_potential_force(pos: np.ndarray, acc: np.ndarray, a_0: np.ndarray):
+    """Add `squared_potential_force` for a single position of shape (3,) to acc in place, without temporaries."""
+    for i in range(3):
+        acc[i] -= a_0[i] * pos[i]
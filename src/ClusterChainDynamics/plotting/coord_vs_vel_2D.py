@@ -1,8 +1,23 @@
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
 
 
-def plot_coord_vs_vel_2D(positions, velocities, time, index, path,  name, title="", xlabel=None, ylabel=None):
+# Figure reused across calls, created on first use. It is not managed by pyplot,
+# so it is rendered with Agg on savefig whatever backend is active.
+_fig = None
+_ax = None
+
+
+def _get_axes():
+    global _fig, _ax
+    if _fig is None:
+        _fig = Figure(figsize=(8, 6))
+        _ax = _fig.add_subplot()
+    _ax.cla()
+    return _fig, _ax
+
+
+def plot_coord_vs_vel_2D(positions, velocities, time, index, path,  name, title="", xlabel=None, ylabel=None, ax=None):
     """
     Plots a 2D scatter plot of a specified coordinate vs. a specified velocity component.
 
@@ -13,17 +28,28 @@ def plot_coord_vs_vel_2D(positions, velocities, time, index, path,  name, title=
         title (str): Title of the plot.
         xlabel (str): Label for the x-axis.
         ylabel (str): Label for the y-axis.
+        ax (matplotlib.axes.Axes): Axes to draw into, e.g. to compose grids. If given, nothing is
+            saved and the caller owns the figure; otherwise a reused figure is saved to path.
+
+    Returns:
+        matplotlib.axes.Axes: The axes drawn into.
     """
-    
+
     label_map = {0: 'x', 1: 'y', 2: 'z'}
     coord_index = label_map.get(index, f'coord{index}')
-    
-    plt.figure(figsize=(8, 6))
-    plt.scatter(positions[:, index], velocities[:, index], c=time, alpha=0.7, cmap='magma')
-    plt.title(title)
-    plt.xlabel(xlabel if xlabel else f"Position {coord_index}")
-    plt.ylabel(ylabel if ylabel else f"Velocity {coord_index}")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(path + f"{name}_coord{index}_vs_vel{index}.png")
-    plt.close()
\ No newline at end of file
+
+    fig = None
+    if ax is None:
+        fig, ax = _get_axes()
+
+    ax.scatter(positions[:, index], velocities[:, index], c=time, alpha=0.7, cmap='magma')
+    ax.set_title(title)
+    ax.set_xlabel(xlabel if xlabel else f"Position {coord_index}")
+    ax.set_ylabel(ylabel if ylabel else f"Velocity {coord_index}")
+    ax.grid(True)
+
+    if fig is not None:
+        fig.tight_layout()
+        fig.savefig(path + f"{name}_coord{index}_vs_vel{index}.png")
+
+    return ax
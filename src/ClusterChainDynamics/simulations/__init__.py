@@ -2,6 +2,7 @@
 Simulation modules for propagating and analyzing compact objects.
 """
 
-from .calculate_path import single_object_solve
+from .calculate_path import single_object_solve, multi_object_solve, multi_object_solve_parallel, batch_solve, warm_up
+from .observe import observe_single_object
 
-__all__ = ['single_object_solve',]
\ No newline at end of file
+__all__ = ['single_object_solve', 'multi_object_solve', 'multi_object_solve_parallel', 'batch_solve', 'warm_up', 'observe_single_object',]
\ No newline at end of file
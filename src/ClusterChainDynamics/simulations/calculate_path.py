@@ -3,66 +3,448 @@ Module for propagating different types of compact objects in simulations.
 """
 
 import numpy as np
-from scipy.integrate import solve_ivp, OdeSolution
-from typing import Dict, Any, Optional, Tuple, Callable
-from functools import partial
+from scipy.integrate import solve_ivp, ode, OdeSolution
+from scipy.optimize import OptimizeResult
+from typing import Dict, Any, List, Optional, Tuple, Callable
+from functools import partial, lru_cache
+import inspect
+import threading
+import os
 
+try:
+    from joblib import Parallel, delayed
+    has_joblib = True
+except ImportError:
+    has_joblib = False
+
+from .._numba import njit, is_jitted
 from ..forces import feedback, gravity
 from ..forces.gravity.galpy_wrapper import _get_galpy_potential
+from ..forces.gravity.squared import _add_squared_potential_force
+from ..forces.gravity.miyamoto_nagai import _add_miyamoto_nagai_force
+from ..forces.gravity.nfw import _add_nfw_force
+from ..forces.gravity.hernquist import _add_hernquist_force
+from ..forces.feedback.constant import _add_constant_feedback
+from ..forces.feedback.linear_time import _add_linear_feedback, _add_linear_feedback_no_sign_flip
+from ..forces.feedback.pulsed_time import _add_pulsed_feedback, _add_windowed_pulsed_feedback
+from .dop853 import dop853_solve, dop853_solve_many
+
+
+# Analytic position Jacobians of the acceleration, called as jac(pos, *potential_args).
+# Galpy potentials carry theirs as the `jacobian` attribute of the force callable.
+_POTENTIAL_JACOBIANS = {
+    gravity.squared_potential_force: gravity.squared_potential_jac,
+    gravity.miyamoto_nagai_force: gravity.miyamoto_nagai_jac,
+    gravity.nfw_force: gravity.nfw_jac,
+    gravity.hernquist_force: gravity.hernquist_jac,
+}
+
+# Jitted kernels adding a model's acceleration for one position into a (3,) array in place,
+# called as add(pos, acc, *potential_args) and add(t, pos, acc, *feedback_args)
+_ACCUMULATING_KERNELS = {
+    gravity.squared_potential_force: _add_squared_potential_force,
+    gravity.miyamoto_nagai_force: _add_miyamoto_nagai_force,
+    gravity.nfw_force: _add_nfw_force,
+    gravity.hernquist_force: _add_hernquist_force,
+    feedback.constant_feedback: _add_constant_feedback,
+    feedback.linear_feedback: _add_linear_feedback,
+    feedback.linear_feedback_no_sign_flip: _add_linear_feedback_no_sign_flip,
+    feedback.pulsed_feedback: _add_pulsed_feedback,
+    feedback.windowed_pulsed_feedback: _add_windowed_pulsed_feedback,
+}
+
+# Feedback models whose acceleration does not depend on position
+_POSITION_INDEPENDENT_FEEDBACK = {getattr(feedback, name) for name in feedback.__all__}
+
+# Preprocessing of feedback parameters required by some models, done once per solve
+_FEEDBACK_PARAM_PREPARATION = {
+    feedback.windowed_pulsed_feedback: feedback.sort_pulses,
+}
+
+# solve_ivp methods that make use of a Jacobian
+_IMPLICIT_METHODS = ("Radau", "BDF", "LSODA")
+
+# Default (rtol, atol) per precision of the returned trajectory
+_DEFAULT_TOLERANCES = {
+    np.dtype(np.float64): (1e-8, 1e-10),
+    np.dtype(np.float32): (1e-5, 1e-6),
+}
+
+# scipy.integrate.ode integrators equivalent to solve_ivp methods
+_ODE_INTEGRATORS = {
+    "RK45": ("dopri5", {}),
+    "DOP853": ("dop853", {}),
+    "LSODA": ("lsoda", {}),
+    "BDF": ("vode", {"method": "bdf"}),
+}
 
         
-def propagate(t: float, pos_and_vel: np.ndarray, calculate_a_g: np.ndarray | Callable[[np.ndarray,], np.ndarray], calculate_a_f: np.ndarray | Callable[[float, np.ndarray,], np.ndarray],) -> np.ndarray: 
+def propagate(
+    t: float,
+    pos_and_vel: np.ndarray,
+    calculate_a_g: Callable[[np.ndarray,], np.ndarray],
+    calculate_a_f: Callable[[float, np.ndarray,], np.ndarray],
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray: 
     """
     Propagate the compact object forward in time, accounting for gravitational
     and feedback forces.
 
+    This is the reference form of the RHS; the solvers build specialized versions of it,
+    see `_specialize_propagate` and `_jit_propagate`.
+
     Args:
         t (float): Time
-        a_g (np.ndarray): Gravitational acceleration vector 
+        pos_and_vel (np.ndarray): State of shape (6,), position followed by velocity
+        calculate_a_g (Callable): Gravitational acceleration, takes the position
+        calculate_a_f (Callable): Feedback acceleration, takes time and position
+        out (Optional[np.ndarray]): Array of shape (6,) the derivative is written into, allocated if None
 
-    This method:
-    1. Calculates feedback forces and mass loss
-    2. Combines gravitational and feedback accelerations
-    3. Updates the object's state using _update()
+    Returns:
+        np.ndarray: Time derivative of the state, i.e. velocity followed by the total acceleration
     """
     pos = pos_and_vel[0:3]
-    vel = pos_and_vel[3:6]
+    if out is None:
+        out = np.empty(6)
+
+    out[0:3] = pos_and_vel[3:6]
+    # Combine gravitational and feedback acceleration without a temporary
+    np.add(calculate_a_g(pos), calculate_a_f(t, pos), out=out[3:6])
+
+    return out
+
+
+def propagate_many(t: float, pos_and_vel: np.ndarray, calculate_a_g: Callable[[np.ndarray,], np.ndarray], calculate_a_f: Callable[[float, np.ndarray,], np.ndarray],) -> np.ndarray:
+    """
+    Right hand side of M independent objects stacked into one state vector.
+
+    Args:
+        t (float): Time
+        pos_and_vel (np.ndarray): Flattened state of shape (6 * M,), laid out as (6, M)
+        calculate_a_g (Callable): Gravitational acceleration, takes positions of shape (3, M)
+        calculate_a_f (Callable): Feedback acceleration, takes time and positions of shape (3, M)
+
+    Returns:
+        np.ndarray: Flattened time derivative of the state, shape (6 * M,)
+    """
+    state = pos_and_vel.reshape(6, -1)
+    pos = state[0:3]
+
+    # Feedback models may return a single (3,) vector shared by all objects
+    a = np.asarray(calculate_a_g(pos)) + np.reshape(calculate_a_f(t, pos), (3, -1))
+
+    return np.concatenate((state[3:6], a)).ravel()
+
+
+def _accumulate_potential(calculate_a_g: Callable) -> Callable:
+    """
+    In-place accumulating kernel of a jitted potential, see `_ACCUMULATING_KERNELS`.
+    """
+    if calculate_a_g in _ACCUMULATING_KERNELS:
+        return _ACCUMULATING_KERNELS[calculate_a_g]
+
+    @njit
+    def _add(pos, acc, *potential_args):
+        a_g = calculate_a_g(pos, *potential_args)
+        for i in range(3):
+            acc[i] += a_g[i]
+
+    return _add
+
+
+def _accumulate_feedback(calculate_a_f: Callable) -> Callable:
+    """
+    In-place accumulating kernel of a jitted feedback model, see `_ACCUMULATING_KERNELS`.
+    """
+    if calculate_a_f in _ACCUMULATING_KERNELS:
+        return _ACCUMULATING_KERNELS[calculate_a_f]
+
+    @njit
+    def _add(t, pos, acc, *feedback_args):
+        a_f = calculate_a_f(t, pos, *feedback_args)
+        for i in range(3):
+            acc[i] += a_f[i]
+
+    return _add
+
+
+@lru_cache(maxsize=None)
+def _jit_propagate(calculate_a_g: Callable, calculate_a_f: Callable) -> Callable:
+    """
+    Compile `propagate` for a fixed pair of jitted force functions.
+
+    The force functions are closed over rather than passed as arguments, so numba
+    resolves both calls at compile time and the compiled RHS is reused for every
+    solve with the same pair. The derivative is written into `out` and returned.
     
-    # Calculate feedback acceleration
-    a_f = calculate_a_f(t, pos)
+    Both accelerations are added directly into `out` by the models' accumulating kernels,
+    so the fused RHS allocates no temporary arrays. Models without such a kernel are
+    wrapped, at the cost of the array they return.
     
-    # Calculate gravitational acceleration
-    a_g = calculate_a_g(pos)
+    Note that solve_ivp's Runge-Kutta solvers keep a reference to the returned
+    derivative across steps (including rejected ones), so `out` may only be reused
+    between calls by integrators that copy it, e.g. LSODA or scipy.integrate.ode.
 
-    # Combine all 
-    print(a_g, a_f)
-    a = a_g + a_f
+    Args:
+        calculate_a_g (Callable): Jitted gravitational acceleration, called as calculate_a_g(pos, *potential_args)
+        calculate_a_f (Callable): Jitted feedback acceleration, called as calculate_a_f(t, pos, *feedback_args)
+
+    Returns:
+        Callable: Jitted RHS with signature (t, pos_and_vel, out, potential_args, feedback_args)
+    """
+
+    add_a_g = _accumulate_potential(calculate_a_g)
+    add_a_f = _accumulate_feedback(calculate_a_f)
+
+    @njit(fastmath=True)
+    def _propagate(t, pos_and_vel, out, potential_args, feedback_args):
+        pos = pos_and_vel[0:3]
+        for i in range(3):
+            out[i] = pos_and_vel[3 + i]
+            out[3 + i] = 0.
+        acc = out[3:6]
+        add_a_g(pos, acc, *potential_args)
+        add_a_f(t, pos, acc, *feedback_args)
+        return out
+
+    return _propagate
+
+
+def _flatten_params(args: Tuple) -> Tuple[np.ndarray, Tuple]:
+    """
+    Concatenate packed parameters (see `_pack_params`) into one float64 array, along with their shapes.
+    """
+    shapes = tuple(np.shape(arg) for arg in args)
+    if not args:
+        return np.empty(0), shapes
+    return np.concatenate([np.ravel(arg) for arg in args]), shapes
+
+
+@lru_cache(maxsize=None)
+def _rhs_codegen(calculate_a_g: Callable, calculate_a_f: Callable, potential_shapes: Tuple, feedback_shapes: Tuple) -> Callable:
+    """
+    Generate and compile `_jit_propagate`'s RHS reading the parameters of both models from one flat array.
     
-    return np.concatenate((vel, a))
+    scipy's integrators call the RHS from Python, so its arguments are unboxed on every call, and one
+    float64 array is much cheaper to unbox than nested tuples of arrays. The generated source slices
+    the array at fixed offsets into the parameters of both models (see `_flatten_params`), so an RHS
+    is compiled per combination of parameter shapes, while parameter values remain run time inputs.
+    Being generated, the source cannot be cached on disk.
     
+    Args:
+        calculate_a_g (Callable): Jitted gravitational acceleration, called as calculate_a_g(pos, *potential_args)
+        calculate_a_f (Callable): Jitted feedback acceleration, called as calculate_a_f(t, pos, *feedback_args)
+        potential_shapes (Tuple): Shapes of the potential parameters, () for scalars
+        feedback_shapes (Tuple): Shapes of the feedback parameters, () for scalars
+    
+    Returns:
+        Callable: Jitted RHS with signature (t, pos_and_vel, out, params)
+    """
+    offset = 0
+    
+    def _slices(shapes):
+        nonlocal offset
+        slices = []
+        for shape in shapes:
+            size = int(np.prod(shape))
+            if shape == ():
+                slices.append(f"params[{offset}]")
+            elif len(shape) == 1:
+                slices.append(f"params[{offset}:{offset + size}]")
+            else:
+                slices.append(f"params[{offset}:{offset + size}].reshape({shape})")
+            offset += size
+        return "".join(", " + item for item in slices)
+    
+    source = "\n".join([
+        "def _propagate(t, pos_and_vel, out, params):",
+        "    pos = pos_and_vel[0:3]",
+        "    for i in range(3):",
+        "        out[i] = pos_and_vel[3 + i]",
+        "        out[3 + i] = 0.",
+        "    acc = out[3:6]",
+        f"    add_a_g(pos, acc{_slices(potential_shapes)})",
+        f"    add_a_f(t, pos, acc{_slices(feedback_shapes)})",
+        "    return out",
+    ])
+    namespace = {"add_a_g": _accumulate_potential(calculate_a_g), "add_a_f": _accumulate_feedback(calculate_a_f)}
+    exec(compile(source, "<generated RHS>", "exec"), namespace)
+    
+    return njit(fastmath=True)(namespace["_propagate"])
 
-def single_object_solve(
-    initial_position: np.ndarray,
-    initial_velocity: np.ndarray,
+
+def _specialize_propagate(calculate_a_g: Callable, potential_args: Tuple, calculate_a_f: Callable, feedback_args: Tuple) -> Callable:
+    """
+    Build `propagate` for fixed force models, used when they are not both jitted.
+
+    Models and parameters are bound in the closure, so each RHS call reaches them
+    without going through `partial` and keyword unpacking.
+
+    The derivative is written into `out` if given, which integrators that copy it
+    (scipy.integrate.ode) can reuse between calls, see `_jit_propagate`.
+    
+    States of shape (6, k) are evaluated column-wise in one call of each model, as
+    solve_ivp does with vectorized=True. The models then receive positions of shape (3, k).
+
+    Args:
+        calculate_a_g (Callable): Gravitational acceleration, called as calculate_a_g(pos, *potential_args)
+        potential_args (Tuple): Positional parameters of the potential
+        calculate_a_f (Callable): Feedback acceleration, called as calculate_a_f(t, pos, *feedback_args)
+        feedback_args (Tuple): Positional parameters of the feedback model
+
+    Returns:
+        Callable: RHS with signature (t, pos_and_vel, out=None)
+    """
+
+    def _propagate(t: float, pos_and_vel: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        pos = pos_and_vel[0:3]
+        if pos_and_vel.ndim == 2:
+            # Feedback models may return a single (3,) vector shared by all columns
+            a = calculate_a_g(pos, *potential_args) + np.reshape(calculate_a_f(t, pos, *feedback_args), (3, -1))
+            return np.concatenate((pos_and_vel[3:6], a))
+        if out is None:
+            out = np.empty(6)
+        out[0:3] = pos_and_vel[3:6]
+        np.add(calculate_a_g(pos, *potential_args), calculate_a_f(t, pos, *feedback_args), out=out[3:6])
+        return out
+
+    return _propagate
+
+
+def _make_jacobian(potential_jac: Callable, potential_args: Tuple) -> Callable:
+    """
+    Build the 6x6 Jacobian of the RHS from the 3x3 position Jacobian of the acceleration.
+
+    The velocity block is the identity, the acceleration block comes from the potential
+    alone, which assumes a position-independent feedback model.
+
+    Args:
+        potential_jac (Callable): Position Jacobian of the potential, called as potential_jac(pos, *potential_args)
+        potential_args (Tuple): Positional parameters of the potential
+
+    Returns:
+        Callable: Jacobian with signature (t, pos_and_vel, *args), where the extra arguments the RHS
+            receives from scipy.integrate.ode (passed on to the Jacobian by LSODA) are ignored
+    """
+    jac = np.zeros((6, 6))
+    jac[0:3, 3:6] = np.eye(3)
+
+    def _jacobian(t, pos_and_vel, *args):
+        jac[3:6, 0:3] = potential_jac(pos_and_vel[0:3], *potential_args)
+        return jac.copy()
+
+    return _jacobian
+
+
+def _solve_ode(
+    fun: Callable,
     t_span: Tuple[float, float],
-    t_eval: np.ndarray,
-    feedback_func: str | Callable[[float, np.ndarray], Tuple[float, float, float]],
-    potential_func: str | Callable[[np.ndarray], Tuple[float, float, float]],
-    feedback_params: Dict,
-    potential_params: Dict = None, # Not needed for galpy potentials
-) -> OdeSolution:
+    y0: np.ndarray,
+    t_eval: Optional[np.ndarray],
+    method: str,
+    rtol: float,
+    atol: float,
+    jac: Optional[Callable] = None,
+    args: Tuple = (),
+) -> OptimizeResult:
     """
-    Propagate a compact object under galactic potential and feedback.
+    Integrate with scipy.integrate.ode, which has far less per-step overhead than solve_ivp.
+    
+    The Fortran integrators copy the derivative returned by `fun`, so `fun` may reuse its
+    output buffer between calls. LSODA and VODE continue from one output time to the next,
+    whereas dopri5/dop853 restart (including the initial step size guess) at every output time,
+    which makes them costly for densely sampled `t_eval`.
     
     Args:
-        initial_conditions (Dict[str, Any]): Initial conditions and parameters for the object
-        t_span (Tuple[float, float]): Time interval (t_start, t_end) in years
-        t_eval (np.ndarray): Times at which to store the solution
-        object_type (str): Type of object to propagate ("star_cluster" or "molecular_cloud")
-        potential (str): Name of the potential to use, can be a galpy potential
+        fun (Callable): RHS with signature (t, y)
+        t_span (Tuple[float, float]): Time interval (t_start, t_end)
+        y0 (np.ndarray): Initial state
+        t_eval (Optional[np.ndarray]): Times at which to store the solution, the end points of t_span if None
+        method (str): solve_ivp method name, mapped to the equivalent ode integrator
+        rtol (float): Relative tolerance
+        atol (float): Absolute tolerance
+        jac (Optional[Callable]): Jacobian with signature (t, y, *args). LSODA passes it the extra
+            arguments of `fun`, the other integrators call it as jac(t, y)
+        args (Tuple): Extra positional arguments passed to `fun`
     
     Returns:
-        Any: Solution object from solve_ivp integration
+        OptimizeResult: Solution with the same `t`, `y`, `status`, `message` and `success` fields as solve_ivp's
+    """
+    if method not in _ODE_INTEGRATORS:
+        raise ValueError(f"_solve_ode: method '{method}' has no scipy.integrate.ode counterpart, use backend='solve_ivp'")
+    integrator_name, integrator_options = _ODE_INTEGRATORS[method]
+    
+    t_eval = np.asarray(t_span, dtype=float) if t_eval is None else np.asarray(t_eval, dtype=float)
+    
+    integrator = ode(fun, jac)
+    integrator.set_integrator(integrator_name, rtol=rtol, atol=atol, nsteps=10**6, **integrator_options)
+    integrator.set_initial_value(y0, t_span[0])
+    integrator.set_f_params(*args)
+    
+    ys = np.empty((len(t_eval), len(y0)))
+    n_done = 0
+    for t in t_eval:
+        ys[n_done] = y0 if t == t_span[0] else integrator.integrate(t)
+        if not integrator.successful():
+            break
+        n_done += 1
+    
+    success = n_done == len(t_eval)
+    return OptimizeResult(
+        t=t_eval[:n_done],
+        y=ys[:n_done].T,
+        status=0 if success else -1,
+        message="The solver successfully reached the end of the integration interval." if success else f"{integrator_name} failed at t={integrator.t}.",
+        success=success,
+    )
+
+
+def _tolerances(dtype: np.dtype, rtol: Optional[float], atol: Optional[float]) -> Tuple[float, float]:
+    """
+    Fill in default tolerances for the requested output precision.
+    """
+    default_rtol, default_atol = _DEFAULT_TOLERANCES[np.dtype(dtype)]
+    return default_rtol if rtol is None else rtol, default_atol if atol is None else atol
+
+
+def _pack_params(func: Callable, params: Optional[Dict], n_fixed: int) -> Tuple:
+    """
+    Order a parameter dictionary by the signature of `func`, skipping its first `n_fixed` arguments.
+    
+    Array-like parameters are converted to contiguous float64 arrays and scalars to floats,
+    so the RHS receives plain positional arguments and jitted models always see the same
+    argument types instead of being recompiled for lists or integer arrays.
+    """
+    if not params:
+        return ()
+    names = list(inspect.signature(getattr(func, "py_func", func)).parameters)[n_fixed:]
+    return tuple(
+        np.ascontiguousarray(params[name], dtype=np.float64) if np.ndim(params[name]) else float(params[name])
+        for name in names if name in params
+    )
+    
+
+def _resolve_models(
+    potential_func: str | Callable,
+    potential_params: Optional[Dict],
+    feedback_func: str | Callable,
+    feedback_params: Optional[Dict],
+    caller: str,
+) -> Tuple[Callable, Optional[Dict], Callable, Optional[Dict]]:
+    """
+    Look up potential and feedback models given by name.
+    
+    Args:
+        potential_func (str | Callable): Galpy potential name, name of a model in `forces.gravity` or callable
+        potential_params (Optional[Dict]): Parameters of a `forces.gravity` model
+        feedback_func (str | Callable): Name of a model in `forces.feedback` or callable
+        feedback_params (Optional[Dict]): Parameters of a `forces.feedback` model
+        caller (str): Name of the calling function, used in error messages
+    
+    Returns:
+        Tuple[Callable, Optional[Dict], Callable, Optional[Dict]]: The models and their parameters,
+            parameters are None for user callables. Galpy potentials are replaced by their jitted closed
+            form and its parameters where available, see `_get_galpy_potential`
     """
     
     if isinstance(potential_func, str):
@@ -72,24 +454,384 @@ def single_object_solve(
             try: 
                 potential_func = getattr(gravity, potential_func) 
             except AttributeError:
-                raise ImportError(f"single_object_solve: potential provided ('{potential_func}') not in galpy or this libary")
-            
-            if potential_params is not None:
-                potential_func = partial(potential_func, **potential_params)
+                raise ImportError(f"{caller}: potential provided ('{potential_func}') not in galpy or this libary")
+        elif hasattr(_potential_func, "closed_form"):
+            potential_func, potential_params = _potential_func.closed_form
         else:
             potential_func = _potential_func
+            potential_params = None
+    else:
+        potential_params = None
             
     
     if isinstance(feedback_func, str):
         try: 
             feedback_func = getattr(feedback, feedback_func) 
-        except ImportError:
-            raise ImportError(f"single_object_solve: feedback model provided ('{feedback_func}') not part of this library")       
-        feedback_func = partial(feedback_func, **feedback_params)
+        except AttributeError:
+            raise ImportError(f"{caller}: feedback model provided ('{feedback_func}') not part of this library")       
+        if feedback_func in _FEEDBACK_PARAM_PREPARATION:
+            feedback_params = _FEEDBACK_PARAM_PREPARATION[feedback_func](feedback_params)
+    else:
+        feedback_params = None
 
     
+    return potential_func, potential_params, feedback_func, feedback_params
+
+
+def single_object_solve(
+    initial_position: np.ndarray,
+    initial_velocity: np.ndarray,
+    t_span: Tuple[float, float],
+    t_eval: np.ndarray,
+    feedback_func: str | Callable[[float, np.ndarray], Tuple[float, float, float]],
+    potential_func: str | Callable[[np.ndarray], Tuple[float, float, float]],
+    feedback_params: Dict,
+    potential_params: Dict = None, # Not needed for galpy potentials
+    method: Optional[str] = None,
+    backend: str = "ode",
+    dense_output: bool = False,
+    dtype: np.dtype = np.float64,
+    rtol: Optional[float] = None,
+    atol: Optional[float] = None,
+    vectorized: bool = False,
+) -> OdeSolution:
+    """
+    Propagate a compact object under galactic potential and feedback.
+    
+    Args:
+        initial_position (np.ndarray): Initial position, shape (3,)
+        initial_velocity (np.ndarray): Initial velocity, shape (3,)
+        t_span (Tuple[float, float]): Time interval (t_start, t_end) in years
+        t_eval (np.ndarray): Times at which to store the solution
+        feedback_func (str | Callable): Name of a model in `forces.feedback` or callable (t, pos) -> acceleration
+        potential_func (str | Callable): Galpy potential name, name of a model in `forces.gravity` or
+            callable pos -> acceleration
+        feedback_params (Dict): Parameters of the feedback model
+        potential_params (Dict): Parameters of the potential, not needed for galpy potentials
+        method (Optional[str]): Integration method in solve_ivp naming, defaults to LSODA, or DOP853 for
+            backend="numba". For the implicit methods (LSODA, Radau, BDF) an analytic Jacobian is supplied
+            for the squared and galpy potentials combined with a position-independent feedback model
+        backend (str): "ode" to integrate with scipy.integrate.ode, which is much cheaper per step
+            for a single 6-dimensional state (RK45, DOP853, LSODA and BDF only), "solve_ivp", or
+            "numba" to run the whole integration in compiled code (DOP853 only, requires numba and
+            jitted models, i.e. galpy potentials only with numba and not user callables)
+        dense_output (bool): Whether solve_ivp should build the continuous solution `sol`. Off by default,
+            the solution is only stored at t_eval; requires backend="solve_ivp"
+        dtype (np.dtype): Precision of the returned trajectory, float64 or float32. scipy's integrators
+            always work in float64 internally, float32 halves the memory of the stored solution and
+            loosens the default tolerances to match
+        rtol (Optional[float]): Relative tolerance, defaults to 1e-8 (float64) or 1e-5 (float32)
+        atol (Optional[float]): Absolute tolerance, defaults to 1e-10 (float64) or 1e-6 (float32)
+        vectorized (bool): Evaluate several states per RHS call, passed on to solve_ivp. Radau and BDF
+            then build finite-difference Jacobians in one call instead of six. Off by default, as the
+            solvers reuse Jacobians and only pay the extra per-call cost for orbits here; useful for
+            user models that force frequent Jacobian updates. Requires backend="solve_ivp" and models
+            accepting positions of shape (3, k)
+    
+    Returns:
+        Any: Solution object with `t` and `y` as returned by solve_ivp
+    """
+    
+    potential_func, potential_params, feedback_func, feedback_params = _resolve_models(
+        potential_func, potential_params, feedback_func, feedback_params, caller="single_object_solve"
+    )
+    
+    potential_args = _pack_params(potential_func, potential_params, 1)
+    feedback_args = _pack_params(feedback_func, feedback_params, 2)
+    
+    if method is None:
+        method = "DOP853" if backend == "numba" else "LSODA"
+    
+    rtol, atol = _tolerances(dtype, rtol, atol)
+    y0 = np.concatenate([initial_position, initial_velocity])
     
-    _propagate = partial(propagate, calculate_a_f=feedback_func, calculate_a_g=potential_func)
+    if backend == "numba":
+        if method != "DOP853" or dense_output:
+            raise ValueError("single_object_solve: backend='numba' only provides method='DOP853' without dense_output")
+        if not (is_jitted(potential_func) and is_jitted(feedback_func)):
+            raise ValueError("single_object_solve: backend='numba' requires numba and jitted potential and feedback models")
+        sol = dop853_solve(_jit_propagate(potential_func, feedback_func), t_span, y0, t_eval, rtol=rtol, atol=atol, args=(potential_args, feedback_args))
+        sol.y = sol.y.astype(dtype, copy=False)
+        return sol
+    
+    if vectorized and backend != "solve_ivp":
+        raise ValueError("single_object_solve: vectorized requires backend='solve_ivp'")
+    
+    if is_jitted(potential_func) and is_jitted(feedback_func) and not vectorized:
+        # Both models compiled: run the whole RHS in numba, parameters handed over in one flat array
+        potential_flat, potential_shapes = _flatten_params(potential_args)
+        feedback_flat, feedback_shapes = _flatten_params(feedback_args)
+        params = np.concatenate((potential_flat, feedback_flat))
+        _jitted = _rhs_codegen(potential_func, feedback_func, potential_shapes, feedback_shapes)
+        if backend == "ode":
+            # The compiled RHS is handed to the integrator directly, with one reused output buffer
+            _propagate = _jitted
+            args = (np.empty(6), params)
+        else:
+            _propagate = lambda t, pos_and_vel: _jitted(t, pos_and_vel, np.empty(6), params)
+            args = ()
+    else:
+        _propagate = _specialize_propagate(potential_func, potential_args, feedback_func, feedback_args)
+        # As for the compiled RHS, only the ode integrators may be handed a reused output buffer
+        args = (np.empty(6),) if backend == "ode" else ()
     
-    return solve_ivp(_propagate, t_span, y0=np.concatenate([initial_position, initial_velocity]), t_eval=t_eval, rtol=1e-8, atol=1e-10)
+    options = {}
+    potential_jac = _POTENTIAL_JACOBIANS.get(potential_func, getattr(potential_func, "jacobian", None))
+    if (method in _IMPLICIT_METHODS and potential_jac is not None
+            and feedback_func in _POSITION_INDEPENDENT_FEEDBACK):
+        options["jac"] = _make_jacobian(potential_jac, potential_args)
+    
+    if backend == "ode":
+        if dense_output:
+            raise ValueError("single_object_solve: dense_output requires backend='solve_ivp'")
+        sol = _solve_ode(_propagate, t_span, y0, t_eval, method=method, rtol=rtol, atol=atol, args=args, **options)
+    elif backend == "solve_ivp":
+        sol = solve_ivp(_propagate, t_span, y0=y0, t_eval=t_eval, method=method, rtol=rtol, atol=atol, dense_output=dense_output, vectorized=vectorized, **options)
+    else:
+        raise ValueError(f"single_object_solve: unknown backend '{backend}', expected 'ode', 'solve_ivp' or 'numba'")
+    
+    sol.y = sol.y.astype(dtype, copy=False)
+    return sol
 
+
+def multi_object_solve(
+    initial_positions: np.ndarray,
+    initial_velocities: np.ndarray,
+    t_span: Tuple[float, float],
+    t_eval: np.ndarray,
+    feedback_func: str | Callable[[float, np.ndarray], np.ndarray],
+    potential_func: str | Callable[[np.ndarray], np.ndarray],
+    feedback_params: Dict,
+    potential_params: Dict = None, # Not needed for galpy potentials
+    method: str = "DOP853",
+    dense_output: bool = False,
+    dtype: np.dtype = np.float64,
+    rtol: Optional[float] = None,
+    atol: Optional[float] = None,
+    chunk_size: Optional[int] = None,
+) -> OdeSolution:
+    """
+    Propagate M independent objects sharing potential and feedback as one joint ODE.
+    
+    A single solve_ivp call integrates all objects, so the solver bookkeeping is paid
+    once and the forces are evaluated for all objects in one vectorized call. Potential
+    and feedback models must accept positions of shape (3, M).
+    
+    All objects share the step size of the hardest one. If a few objects need much smaller
+    steps than the rest, `chunk_size` splits them into separately integrated groups.
+    
+    Args:
+        initial_positions (np.ndarray): Initial positions, shape (M, 3)
+        initial_velocities (np.ndarray): Initial velocities, shape (M, 3)
+        t_span (Tuple[float, float]): Time interval (t_start, t_end) in years
+        t_eval (np.ndarray): Times at which to store the solution
+        feedback_func (str | Callable): Feedback model, see `single_object_solve`
+        potential_func (str | Callable): Potential, see `single_object_solve`
+        feedback_params (Dict): Parameters of the feedback model
+        potential_params (Dict): Parameters of the potential, not needed for galpy potentials
+        method (str): Integration method passed to solve_ivp. Implicit methods are a poor fit, as
+            their finite-difference Jacobian of the joint system costs 6 * M RHS evaluations
+        dense_output (bool): Whether solve_ivp should build the continuous solution `sol`. Off by default;
+            if enabled, `sol` evaluates the flattened joint state laid out as (6, M). Not available with chunk_size
+        dtype (np.dtype): Precision of the returned trajectories, see `single_object_solve`
+        rtol (Optional[float]): Relative tolerance, defaults to 1e-8 (float64) or 1e-5 (float32)
+        atol (Optional[float]): Absolute tolerance, defaults to 1e-10 (float64) or 1e-6 (float32)
+        chunk_size (Optional[int]): If given, integrate the objects in independent groups of this size
+            and combine the results; requires t_eval
+    
+    Returns:
+        Any: Solution object from solve_ivp integration, with `y` of shape (M, 6, len(t))
+    """
+    
+    potential_func, potential_params, feedback_func, feedback_params = _resolve_models(
+        potential_func, potential_params, feedback_func, feedback_params, caller="multi_object_solve"
+    )
+    # Parameters normalized as in single_object_solve, e.g. lists to float64 arrays for jitted models
+    potential_args = _pack_params(potential_func, potential_params, 1)
+    feedback_args = _pack_params(feedback_func, feedback_params, 2)
+    
+    _propagate = partial(
+        propagate_many,
+        calculate_a_g=lambda pos: potential_func(pos, *potential_args),
+        calculate_a_f=lambda t, pos: feedback_func(t, pos, *feedback_args),
+    )
+    rtol, atol = _tolerances(dtype, rtol, atol)
+    
+    def _solve(positions, velocities):
+        n_objects = len(positions)
+        y0 = np.concatenate([np.transpose(positions), np.transpose(velocities)]).ravel()
+        sol = solve_ivp(_propagate, t_span, y0=y0, t_eval=t_eval, method=method, rtol=rtol, atol=atol, dense_output=dense_output)
+        # Copy into (M, 6, len(t)) order, so each object's trajectory is contiguous
+        sol.y = np.ascontiguousarray(sol.y.reshape(6, n_objects, -1).transpose(1, 0, 2), dtype=dtype)
+        return sol
+    
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"multi_object_solve: chunk_size must be at least 1, got {chunk_size}")
+    
+    if chunk_size is None or chunk_size >= len(initial_positions):
+        return _solve(initial_positions, initial_velocities)
+    
+    if t_eval is None or dense_output:
+        raise ValueError("multi_object_solve: chunk_size requires t_eval and no dense_output")
+    
+    sols = [
+        _solve(initial_positions[i:i + chunk_size], initial_velocities[i:i + chunk_size])
+        for i in range(0, len(initial_positions), chunk_size)
+    ]
+    failed = [sol for sol in sols if not sol.success]
+    sol = failed[0] if failed else sols[0]
+    n_times = min(len(s.t) for s in sols)
+    sol.t = sol.t[:n_times]
+    sol.y = np.concatenate([s.y[:, :, :n_times] for s in sols])
+    sol.nfev = sum(s.nfev for s in sols)
+    
+    return sol
+
+
+def multi_object_solve_parallel(
+    initial_positions: np.ndarray,
+    initial_velocities: np.ndarray,
+    t_span: Tuple[float, float],
+    t_eval: np.ndarray,
+    feedback_func: str | Callable[[float, np.ndarray], np.ndarray],
+    potential_func: str | Callable[[np.ndarray], np.ndarray],
+    feedback_params: Dict,
+    potential_params: Dict = None, # Not needed for galpy potentials
+    method: Optional[str] = None,
+    dtype: np.dtype = np.float64,
+    rtol: Optional[float] = None,
+    atol: Optional[float] = None,
+    n_jobs: int = -1,
+) -> OdeSolution:
+    """
+    Propagate M independent objects in parallel, each with its own step sizes.
+    
+    With numba and jitted models, all objects are integrated by the compiled DOP853 integrator
+    (see `single_object_solve` with backend="numba") in threads, which run without the GIL and
+    without any Python overhead per object or step. Otherwise the objects are solved one by one with
+    `single_object_solve` in joblib worker processes, see `batch_solve`. Unlike `multi_object_solve`,
+    an object needing small steps does not slow down the others.
+    
+    Args:
+        initial_positions (np.ndarray): Initial positions, shape (M, 3)
+        initial_velocities (np.ndarray): Initial velocities, shape (M, 3)
+        t_span (Tuple[float, float]): Time interval (t_start, t_end) in years
+        t_eval (np.ndarray): Times at which to store the solution
+        feedback_func (str | Callable): Feedback model, see `single_object_solve`
+        potential_func (str | Callable): Potential, see `single_object_solve`
+        feedback_params (Dict): Parameters of the feedback model
+        potential_params (Dict): Parameters of the potential, not needed for galpy potentials
+        method (Optional[str]): Integration method. Defaults to DOP853, which runs in threads for
+            jitted models; other methods are solved in worker processes
+        dtype (np.dtype): Precision of the returned trajectories, see `single_object_solve`
+        rtol (Optional[float]): Relative tolerance, defaults to 1e-8 (float64) or 1e-5 (float32)
+        atol (Optional[float]): Absolute tolerance, defaults to 1e-10 (float64) or 1e-6 (float32)
+        n_jobs (int): Number of threads, or of worker processes without the numba route. Negative values
+            count back from the number of cores as in joblib, -1 uses all cores, -2 all but one
+    
+    Returns:
+        Any: Solution object with `y` of shape (M, 6, len(t)), `t` up to the last time reached by all objects
+    """
+    
+    if n_jobs == 0:
+        raise ValueError("multi_object_solve_parallel: n_jobs must be a positive or negative number of jobs, not 0")
+    
+    _potential_func, _potential_params, _feedback_func, _feedback_params = _resolve_models(
+        potential_func, potential_params, feedback_func, feedback_params, caller="multi_object_solve_parallel"
+    )
+    
+    if method in (None, "DOP853") and is_jitted(_potential_func) and is_jitted(_feedback_func):
+        rtol, atol = _tolerances(dtype, rtol, atol)
+        y0s = np.concatenate([initial_positions, initial_velocities], axis=1)
+        args = (_pack_params(_potential_func, _potential_params, 1), _pack_params(_feedback_func, _feedback_params, 2))
+        sol = dop853_solve_many(
+            _jit_propagate(_potential_func, _feedback_func), t_span, y0s, t_eval, rtol=rtol, atol=atol, args=args,
+            n_threads=n_jobs if n_jobs > 0 else max(1, (os.cpu_count() or 1) + 1 + n_jobs), dtype=dtype,
+        )
+        return sol
+    
+    # Models are passed on as given, so cases given by name can be sent to the workers
+    cases = [
+        dict(
+            initial_position=position, initial_velocity=velocity, t_span=t_span, t_eval=t_eval,
+            feedback_func=feedback_func, potential_func=potential_func,
+            feedback_params=feedback_params, potential_params=potential_params,
+            method=method, dtype=dtype, rtol=rtol, atol=atol,
+        )
+        for position, velocity in zip(initial_positions, initial_velocities)
+    ]
+    sols = batch_solve(cases, n_jobs=n_jobs)
+    failed = [sol for sol in sols if not sol.success]
+    sol = failed[0] if failed else sols[0]
+    n_times = min(len(s.t) for s in sols)
+    sol.t = sol.t[:n_times]
+    sol.y = np.stack([s.y[:, :n_times] for s in sols])
+    
+    return sol
+
+
+def batch_solve(cases: List[Dict[str, Any]], n_jobs: int = -1) -> List[OdeSolution]:
+    """
+    Run independent `single_object_solve` calls, e.g. a parameter scan, in parallel processes.
+    
+    Models should be given by name (or as importable top-level functions) so the cases can be
+    sent to the worker processes. Each worker compiles the jitted RHS once on first use.
+    Without joblib installed the cases are solved one after the other.
+    
+    Args:
+        cases (List[Dict[str, Any]]): Keyword arguments of `single_object_solve`, one dictionary per solve
+        n_jobs (int): Number of worker processes, -1 uses all cores
+    
+    Returns:
+        List[OdeSolution]: Solutions in the order of `cases`
+    """
+    if not has_joblib or n_jobs == 1:
+        return [single_object_solve(**case) for case in cases]
+    return Parallel(n_jobs=n_jobs, backend="loky")(delayed(single_object_solve)(**case) for case in cases)
+
+
+def warm_up(
+    feedback_func: str | Callable,
+    potential_func: str | Callable,
+    feedback_params: Dict,
+    potential_params: Dict = None,
+    backend: str = "ode",
+    background: bool = False,
+) -> Optional[threading.Thread]:
+    """
+    Compile the jitted RHS, and for backend="numba" the integrator, of a pair of models ahead of the first solve.
+    
+    Compiled code is kept for the lifetime of the process and shared by all solves with the same models,
+    as parameters are passed at run time; only parameters of different shape or type compile again.
+    It is specialized on the models themselves and therefore cannot be cached on disk. Warming up runs
+    a very short solve, which is cheap apart from the compilation.
+    
+    Args:
+        feedback_func (str | Callable): Feedback model, see `single_object_solve`
+        potential_func (str | Callable): Potential, see `single_object_solve`
+        feedback_params (Dict): Parameters of the feedback model, only their shapes and types matter
+        potential_params (Dict): Parameters of the potential, not needed for galpy potentials
+        backend (str): Backend to compile for, see `single_object_solve`
+        background (bool): Compile in a daemon thread, e.g. while the initial conditions are prepared.
+            Solves started meanwhile wait for the compilation instead of repeating it
+    
+    Returns:
+        Optional[threading.Thread]: The compiling thread if background is set, otherwise None
+    """
+    case = dict(
+        initial_position=np.ones(3),
+        initial_velocity=np.zeros(3),
+        t_span=(0., 1e-3),
+        t_eval=None,
+        feedback_func=feedback_func,
+        potential_func=potential_func,
+        feedback_params=feedback_params,
+        potential_params=potential_params,
+        backend=backend,
+    )
+    if not background:
+        single_object_solve(**case)
+        return None
+    thread = threading.Thread(target=single_object_solve, kwargs=case, daemon=True)
+    thread.start()
+    return thread
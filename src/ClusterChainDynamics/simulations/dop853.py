@@ -0,0 +1,385 @@
+"""
+DOP853 Runge-Kutta integrator compiled with numba.
+
+The whole integration loop runs in compiled code, so a solve costs no Python calls per
+step. Coefficients, step size control and the dense output used for `t_eval` follow
+scipy's DOP853 in solve_ivp, so both give the same solution up to rounding.
+"""
+
+import numpy as np
+from scipy.optimize import OptimizeResult
+from typing import Callable, Optional, Tuple
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+from .._numba import njit
+from . import _dop853_coefficients as dop853_coefficients
+
+
+_N_STAGES = dop853_coefficients.N_STAGES
+_N_STAGES_EXTENDED = dop853_coefficients.N_STAGES_EXTENDED
+_INTERPOLATOR_POWER = dop853_coefficients.INTERPOLATOR_POWER
+_A = np.ascontiguousarray(dop853_coefficients.A)
+_B = np.ascontiguousarray(dop853_coefficients.B)
+_C = np.ascontiguousarray(dop853_coefficients.C)
+_E3 = np.ascontiguousarray(dop853_coefficients.E3)
+_E5 = np.ascontiguousarray(dop853_coefficients.E5)
+_D = np.ascontiguousarray(dop853_coefficients.D)
+
+# Step size control as in scipy.integrate.RungeKutta, with the error estimator of order 7
+_SAFETY = 0.9
+_MIN_FACTOR = 0.2
+_MAX_FACTOR = 10.
+_ERROR_EXPONENT = -1. / 8.
+
+
+@lru_cache(maxsize=None)
+def _jit_dop853(rhs: Callable) -> Callable:
+    """
+    Compile the DOP853 loop for a fixed jitted RHS.
+
+    Like the RHS itself, the integrator closes over `rhs`, so the call is resolved at compile
+    time and each RHS is compiled into its own integrator once per process.
+
+    Args:
+        rhs (Callable): Jitted RHS called as rhs(t, y, out, *args), writing the derivative into `out`
+
+    Returns:
+        Callable: Jitted integrator with signature (t0, t1, y0, t_eval, rtol, atol, max_steps, args),
+            returning the states at t_eval, the number of stored states, a status and the number of RHS calls
+    """
+
+    @njit
+    def _stage(t, h, y, K, s, y_stage, args):
+        # K[s] = f(t + c_s h, y + h sum_k a_sk K[k])
+        for j in range(y.shape[0]):
+            dy = 0.
+            for k in range(s):
+                dy += _A[s, k] * K[k, j]
+            y_stage[j] = y[j] + h * dy
+        rhs(t + _C[s] * h, y_stage, K[s], *args)
+
+    @njit
+    def _rms_norm(x, scale):
+        total = 0.
+        for j in range(x.shape[0]):
+            total += (x[j] / scale[j])**2
+        return np.sqrt(total / x.shape[0])
+
+    @njit
+    def _dop853(t0, t1, y0, t_eval, rtol, atol, max_steps, args):
+        n = y0.shape[0]
+        n_out = t_eval.shape[0]
+        ys = np.empty((n_out, n))
+
+        y = y0.copy()
+        y_new = np.empty(n)
+        y_stage = np.empty(n)
+        scale = np.empty(n)
+        K = np.empty((_N_STAGES_EXTENDED, n))
+        F = np.empty((_INTERPOLATOR_POWER, n))
+        f = np.empty(n)
+
+        t = t0
+        direction = 1. if t1 >= t0 else -1.
+        i_out = 0
+        while i_out < n_out and t_eval[i_out] == t0:
+            ys[i_out] = y
+            i_out += 1
+
+        rhs(t, y, f, *args)
+        nfev = 1
+
+        # Initial step size as in scipy.integrate._ivp.common.select_initial_step
+        interval_length = abs(t1 - t0)
+        for j in range(n):
+            scale[j] = atol + abs(y[j]) * rtol
+        d0 = _rms_norm(y, scale)
+        d1 = _rms_norm(f, scale)
+        h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        h0 = min(h0, interval_length)
+        for j in range(n):
+            y_stage[j] = y[j] + h0 * direction * f[j]
+        rhs(t + h0 * direction, y_stage, K[0], *args)
+        nfev += 1
+        for j in range(n):
+            K[0, j] -= f[j]
+        d2 = _rms_norm(K[0], scale) / h0 if h0 > 0. else 0.
+        if d1 <= 1e-15 and d2 <= 1e-15:
+            h1 = max(1e-6, h0 * 1e-3)
+        else:
+            h1 = (0.01 / max(d1, d2))**(-_ERROR_EXPONENT)
+        h_abs = min(100. * h0, h1, interval_length)
+
+        status = 0
+        n_steps = 0
+        while direction * (t - t1) < 0.:
+            if n_steps == max_steps:
+                status = -1
+                break
+            n_steps += 1
+            # Step size control as in scipy.integrate.RungeKutta._step_impl, with max_step = inf as in
+            # solve_ivp's default: a step below the minimum is first raised to it, and only fails if
+            # that step is rejected again
+            min_step = 10. * abs(np.nextafter(t, direction * np.inf) - t)
+            if h_abs < min_step:
+                h_abs = min_step
+
+            step_rejected = False
+            while True:
+                if h_abs < min_step:
+                    status = -1
+                    break
+                t_new = t + h_abs * direction
+                if direction * (t_new - t1) > 0.:
+                    t_new = t1
+                h = t_new - t
+                h_abs = abs(h)
+
+                K[0] = f
+                for s in range(1, _N_STAGES):
+                    _stage(t, h, y, K, s, y_stage, args)
+                for j in range(n):
+                    dy = 0.
+                    for k in range(_N_STAGES):
+                        dy += _B[k] * K[k, j]
+                    y_new[j] = y[j] + h * dy
+                rhs(t_new, y_new, K[_N_STAGES], *args)
+                nfev += _N_STAGES
+
+                # Error norm combining the embedded 5th and 3rd order estimates
+                err5 = 0.
+                err3 = 0.
+                for j in range(n):
+                    sc = atol + max(abs(y[j]), abs(y_new[j])) * rtol
+                    e5 = 0.
+                    e3 = 0.
+                    for k in range(_N_STAGES + 1):
+                        e5 += _E5[k] * K[k, j]
+                        e3 += _E3[k] * K[k, j]
+                    err5 += (e5 / sc)**2
+                    err3 += (e3 / sc)**2
+                if err5 == 0. and err3 == 0.:
+                    error_norm = 0.
+                else:
+                    error_norm = h_abs * err5 / np.sqrt((err5 + 0.01 * err3) * n)
+
+                if error_norm < 1.:
+                    if error_norm == 0.:
+                        factor = _MAX_FACTOR
+                    else:
+                        factor = min(_MAX_FACTOR, _SAFETY * error_norm**_ERROR_EXPONENT)
+                    if step_rejected:
+                        factor = min(1., factor)
+                    h_abs *= factor
+                    break
+                h_abs *= max(_MIN_FACTOR, _SAFETY * error_norm**_ERROR_EXPONENT)
+                step_rejected = True
+
+            if status != 0:
+                break
+
+            # Dense output, only built for steps containing output times
+            if i_out < n_out and direction * (t_eval[i_out] - t_new) <= 0.:
+                for s in range(_N_STAGES + 1, _N_STAGES_EXTENDED):
+                    _stage(t, h, y, K, s, y_stage, args)
+                nfev += _N_STAGES_EXTENDED - _N_STAGES - 1
+                for j in range(n):
+                    delta_y = y_new[j] - y[j]
+                    F[0, j] = delta_y
+                    F[1, j] = h * K[0, j] - delta_y
+                    F[2, j] = 2. * delta_y - h * (K[_N_STAGES, j] + K[0, j])
+                    for i in range(_INTERPOLATOR_POWER - 3):
+                        dy = 0.
+                        for k in range(_N_STAGES_EXTENDED):
+                            dy += _D[i, k] * K[k, j]
+                        F[3 + i, j] = h * dy
+                while i_out < n_out and direction * (t_eval[i_out] - t_new) <= 0.:
+                    x = (t_eval[i_out] - t) / h
+                    for j in range(n):
+                        value = 0.
+                        for i in range(_INTERPOLATOR_POWER):
+                            value += F[_INTERPOLATOR_POWER - 1 - i, j]
+                            value *= x if i % 2 == 0 else 1. - x
+                        ys[i_out, j] = y[j] + value
+                    i_out += 1
+
+            t = t_new
+            y[:] = y_new
+            f[:] = K[_N_STAGES]
+
+        return ys, i_out, status, nfev
+
+    return _dop853
+
+
+@lru_cache(maxsize=None)
+def _jit_dop853_many(rhs: Callable) -> Callable:
+    """
+    Compile a driver integrating a range of initial states with `_jit_dop853(rhs)`.
+
+    The driver releases the GIL, so several ranges can be integrated concurrently in Python threads.
+
+    Args:
+        rhs (Callable): Jitted RHS called as rhs(t, y, out, *args), writing the derivative into `out`
+
+    Returns:
+        Callable: Jitted driver with signature (t0, t1, y0s, t_eval, rtol, atol, max_steps, args, start, stop,
+            ys, n_done, status, nfev), storing the states of objects start to stop-1 in ys of shape
+            (M, n, len(t_eval)) and their number of stored states, status and number of RHS calls
+    """
+    _dop853 = _jit_dop853(rhs)
+
+    @njit(nogil=True)
+    def _dop853_many(t0, t1, y0s, t_eval, rtol, atol, max_steps, args, start, stop, ys, n_done, status, nfev):
+        for i in range(start, stop):
+            ys_i, n_done[i], status[i], nfev[i] = _dop853(t0, t1, y0s[i], t_eval, rtol, atol, max_steps, args)
+            ys[i] = ys_i.T
+
+    return _dop853_many
+
+def _prepare_t_eval(t_span: Tuple[float, float], t_eval: Optional[np.ndarray], caller: str) -> np.ndarray:
+    """
+    Output times as a float array, checked as in solve_ivp, since the compiled loop silently drops
+    times outside t_span and stops storing at the first time out of order.
+
+    Args:
+        t_span (Tuple[float, float]): Time interval (t_start, t_end)
+        t_eval (Optional[np.ndarray]): Times at which to store the solution; the end points of t_span if None
+        caller (str): Name of the calling function, used in error messages
+
+    Returns:
+        np.ndarray: Output times
+    """
+    if t_eval is None:
+        return np.asarray(t_span, dtype=float)
+    t_eval = np.asarray(t_eval, dtype=float)
+    if t_eval.ndim != 1:
+        raise ValueError(f"{caller}: t_eval must be 1-dimensional")
+    t0, t1 = t_span
+    if np.any(t_eval < min(t0, t1)) or np.any(t_eval > max(t0, t1)):
+        raise ValueError(f"{caller}: values in t_eval are not within t_span")
+    d = np.diff(t_eval)
+    if (t1 > t0 and np.any(d <= 0)) or (t1 < t0 and np.any(d >= 0)):
+        raise ValueError(f"{caller}: values in t_eval are not properly sorted")
+    return t_eval
+
+
+def dop853_solve(
+    rhs: Callable,
+    t_span: Tuple[float, float],
+    y0: np.ndarray,
+    t_eval: Optional[np.ndarray],
+    rtol: float,
+    atol: float,
+    args: Tuple = (),
+    max_steps: int = 10**6,
+) -> OptimizeResult:
+    """
+    Integrate with the compiled DOP853 method.
+
+    Args:
+        rhs (Callable): Jitted RHS called as rhs(t, y, out, *args), writing the derivative into `out`
+        t_span (Tuple[float, float]): Time interval (t_start, t_end)
+        y0 (np.ndarray): Initial state
+        t_eval (Optional[np.ndarray]): Times at which to store the solution, within t_span and sorted in
+            the direction of integration; the end points of t_span if None
+        rtol (float): Relative tolerance
+        atol (float): Absolute tolerance
+        args (Tuple): Extra positional arguments passed to `rhs`
+        max_steps (int): Maximum number of accepted steps
+
+    Returns:
+        OptimizeResult: Solution with the same `t`, `y`, `nfev`, `status`, `message` and `success` fields as solve_ivp's
+    """
+    t_eval = _prepare_t_eval(t_span, t_eval, "dop853_solve")
+
+    ys, n_done, status, nfev = _jit_dop853(rhs)(
+        float(t_span[0]), float(t_span[1]), np.asarray(y0, dtype=np.float64), t_eval,
+        float(rtol), float(atol), max_steps, args,
+    )
+
+    success = status == 0
+    return OptimizeResult(
+        t=t_eval[:n_done],
+        y=ys[:n_done].T,
+        nfev=nfev,
+        status=status,
+        message="The solver successfully reached the end of the integration interval." if success else "DOP853 failed to reach the end of the integration interval.",
+        success=success,
+    )
+
+
+def dop853_solve_many(
+    rhs: Callable,
+    t_span: Tuple[float, float],
+    y0s: np.ndarray,
+    t_eval: Optional[np.ndarray],
+    rtol: float,
+    atol: float,
+    args: Tuple = (),
+    max_steps: int = 10**6,
+    n_threads: Optional[int] = None,
+    dtype: np.dtype = np.float64,
+) -> OptimizeResult:
+    """
+    Integrate independent initial states with the compiled DOP853 method, spread over threads.
+
+    Every object is integrated with its own step sizes. The compiled integrator runs without the GIL,
+    so the threads scale with the number of cores. The objects are handed out in several chunks per
+    thread to even out objects of different difficulty.
+
+    Args:
+        rhs (Callable): Jitted RHS called as rhs(t, y, out, *args), writing the derivative into `out`
+        t_span (Tuple[float, float]): Time interval (t_start, t_end)
+        y0s (np.ndarray): Initial states, shape (M, n)
+        t_eval (Optional[np.ndarray]): Times at which to store the solution, see `dop853_solve`
+        rtol (float): Relative tolerance
+        atol (float): Absolute tolerance
+        args (Tuple): Extra positional arguments passed to `rhs`
+        max_steps (int): Maximum number of accepted steps per object
+        n_threads (Optional[int]): Number of threads, all cores if None
+        dtype (np.dtype): Precision in which the trajectories are stored. The integration runs in float64,
+            each object's trajectory is converted as soon as it is done, so float32 halves the memory of
+            the result without a float64 copy of it
+
+    Returns:
+        OptimizeResult: Solution with `y` of shape (M, n, len(t)), `t` up to the last time reached by all
+            objects, the total `nfev`, and `status`, `message` and `success` covering all objects
+    """
+    t_eval = _prepare_t_eval(t_span, t_eval, "dop853_solve_many")
+
+    y0s = np.ascontiguousarray(y0s, dtype=np.float64)
+    n_objects, n = y0s.shape
+    ys = np.empty((n_objects, n, len(t_eval)), dtype=dtype)
+    n_done = np.zeros(n_objects, dtype=np.int64)
+    status = np.zeros(n_objects, dtype=np.int64)
+    nfev = np.zeros(n_objects, dtype=np.int64)
+
+    driver = _jit_dop853_many(rhs)
+    n_threads = (os.cpu_count() or 1) if n_threads is None else n_threads
+    if n_threads < 1:
+        raise ValueError(f"dop853_solve_many: n_threads must be at least 1, got {n_threads}")
+    chunk_size = max(1, n_objects // (4 * n_threads))
+
+    def _solve_chunk(start):
+        driver(
+            float(t_span[0]), float(t_span[1]), y0s, t_eval, float(rtol), float(atol), max_steps, args,
+            start, min(start + chunk_size, n_objects), ys, n_done, status, nfev,
+        )
+
+    with ThreadPoolExecutor(n_threads) as pool:
+        # list() propagates exceptions raised in the threads
+        list(pool.map(_solve_chunk, range(0, n_objects, chunk_size)))
+
+    n_times = n_done.min(initial=len(t_eval))
+    success = bool(np.all(status == 0))
+    return OptimizeResult(
+        t=t_eval[:n_times],
+        y=ys[:, :, :n_times],
+        nfev=int(nfev.sum()),
+        status=0 if success else -1,
+        message="The solver successfully reached the end of the integration interval." if success else f"DOP853 failed for {np.count_nonzero(status)} objects.",
+        success=success,
+    )
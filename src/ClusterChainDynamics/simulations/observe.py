@@ -1,22 +1,73 @@
 from scipy.integrate import OdeSolution
 import numpy as np
-from typing import Dict, Callable
+from typing import Dict, Callable, Optional
 
 
 def observe_single_object(
     solution: OdeSolution,
     observation_times: np.ndarray,
-    noise_std: np.ndarray,
+    noise_std: float | np.ndarray,
     positional_response: Callable = None,
     velocity_response: Callable = None,
+    rng: Optional[np.random.Generator] = None,
 ) -> Dict[str, np.ndarray]:
     """
-    Observe the trajectory and mass evolution of a single compact object
-    from the integration solution.
-    
+    Observe the trajectory of a single compact object from the integration solution,
+    with Gaussian measurement noise.
+
+    The solution stores the state as y of shape (6, n_times), so every coordinate is a
+    contiguous row. The rows are sampled at the observation times one by one and the
+    trajectory is never transposed. The continuous solution `sol` is used where available
+    (dense_output=True), otherwise the stored states are interpolated linearly.
+
     Args:
         solution (OdeResult): The result from the ODE solver containing time points
-                              and state vectors.   
+                              and state vectors.
+        observation_times (np.ndarray): Times of the observations, within the stored times of the solution
+        noise_std (float | np.ndarray): Standard deviation of the noise, a scalar or one value per observed
+            component, i.e. broadcastable to (n_components, 1) with the position components first
+        positional_response (Callable): Maps positions of shape (3, n_obs) to the observed quantities,
+            e.g. a projection; identity if None
+        velocity_response (Callable): Maps velocities of shape (3, n_obs) to the observed quantities;
+            identity if None
+        rng (Optional[np.random.Generator]): Random number generator for the noise
+
+    Returns:
+        Dict[str, np.ndarray]: Observation times under "times", noisy observed positions and velocities
+            under "positions" and "velocities", each with one row per component
+
+    Raises:
+        ValueError: If observation times lie outside [solution.t[0], solution.t[-1]], where the
+            continuous solution would extrapolate and linear interpolation would clamp
     """
-    times = solution.t
-    positions = solution.y.T  # Transpose to get shape (n_times, n_dimensions)
\ No newline at end of file
+    observation_times = np.asarray(observation_times, dtype=float)
+    t_first, t_last = sorted((solution.t[0], solution.t[-1]))
+    if np.any(observation_times < t_first) or np.any(observation_times > t_last):
+        raise ValueError(
+            f"observe_single_object: observation times must lie within the solution's time range [{t_first}, {t_last}]"
+        )
+
+    if getattr(solution, "sol", None) is not None:
+        states = solution.sol(observation_times)
+    else:
+        states = np.stack([np.interp(observation_times, solution.t, row) for row in solution.y])
+
+    n_obs = len(observation_times)
+    positions = states[0:3] if positional_response is None else positional_response(states[0:3])
+    velocities = states[3:6] if velocity_response is None else velocity_response(states[3:6])
+    positions = np.reshape(positions, (-1, n_obs))
+    velocities = np.reshape(velocities, (-1, n_obs))
+
+    # Noise for all components in one vectorized draw
+    observed = np.concatenate((positions, velocities))
+    noise_std = np.asarray(noise_std, dtype=float)
+    if noise_std.ndim == 1:
+        noise_std = noise_std[:, None]
+    rng = np.random.default_rng() if rng is None else rng
+    observed += noise_std * rng.standard_normal(observed.shape)
+
+    return {
+        "times": observation_times,
+        "positions": observed[:len(positions)],
+        "velocities": observed[len(positions):],
+    }
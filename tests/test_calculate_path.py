@@ -0,0 +1,242 @@
+"""Test module for the orbit integration in ClusterChainDynamics.simulations."""
+
+import numpy as np
+import pytest
+
+from ClusterChainDynamics import single_object_solve, multi_object_solve, multi_object_solve_parallel, batch_solve, warm_up
+from ClusterChainDynamics._numba import has_numba
+
+requires_numba = pytest.mark.skipif(not has_numba, reason="numba not installed")
+
+
+@pytest.mark.parametrize("method, backend", [
+    ("RK45", "ode"), ("LSODA", "ode"), ("RK45", "solve_ivp"), ("Radau", "solve_ivp"),
+    pytest.param("DOP853", "numba", marks=requires_numba),
+])
+def test_squared_potential_constant_feedback(method, backend):
+    """Test the harmonic oscillator with a constant offset against its analytic solution."""
+    t_eval = np.linspace(0., 10., 50)
+    sol = single_object_solve(
+        initial_position=np.array([0., 0., 1.]),
+        initial_velocity=np.array([0., 0., 0.]),
+        t_span=(0., 10.),
+        t_eval=t_eval,
+        potential_func="squared_potential_force",
+        feedback_func="constant_feedback",
+        potential_params=dict(a_0=np.array([0., 0., 1.])),
+        feedback_params=dict(a_0=-np.array([0., 0., 1.])),
+        method=method,
+        backend=backend,
+    )
+    # z'' = -z - 1 with z(0) = 1, z'(0) = 0
+    np.testing.assert_allclose(sol.y[2], -1. + 2. * np.cos(t_eval), atol=1e-6)
+    np.testing.assert_allclose(sol.y[5], -2. * np.sin(t_eval), atol=1e-6)
+    np.testing.assert_allclose(sol.y[[0, 1, 3, 4]], 0.)
+
+
+@requires_numba
+def test_numba_backend_matches_solve_ivp():
+    """Test that the compiled DOP853 takes the same steps as solve_ivp's DOP853 and rejects the same t_eval."""
+    models = dict(
+        potential_func="squared_potential_force",
+        feedback_func="constant_feedback",
+        potential_params=dict(a_0=np.array([1., 2., 3.])),
+        feedback_params=dict(a_0=np.array([0., 0., -0.1])),
+    )
+    # solve_ivp builds the dense output of the first step for an output time at t_span[0], so start later
+    t_eval = np.linspace(1., 50., 200)
+    sols = [
+        single_object_solve(np.array([1., 0.5, -0.3]), np.array([0., 0.2, 0.1]), t_span=(0., 50.), t_eval=t_eval,
+                            method="DOP853", backend=backend, rtol=1e-10, atol=1e-12, **models)
+        for backend in ("numba", "solve_ivp")
+    ]
+    assert sols[0].nfev == sols[1].nfev
+    np.testing.assert_allclose(sols[0].y, sols[1].y, rtol=0., atol=1e-13)
+    for t_eval in (np.linspace(0., 60., 10), np.array([0., 20., 10.])):
+        with pytest.raises(ValueError):
+            single_object_solve(np.array([1., 0.5, -0.3]), np.array([0., 0.2, 0.1]), t_span=(0., 50.), t_eval=t_eval,
+                                method="DOP853", backend="numba", **models)
+
+
+@requires_numba
+def test_numba_backend_minimum_step():
+    """Test that a first step below the minimum step at large t is raised to it, as in solve_ivp."""
+    models = dict(
+        potential_func="squared_potential_force",
+        feedback_func="constant_feedback",
+        potential_params=dict(a_0=np.array([1., 1., 1.])),
+        feedback_params=dict(a_0=np.array([0., 0., 1.])),
+    )
+    t0 = 1e12
+    t_eval = t0 + np.linspace(1., 10., 10)
+    sols = [
+        single_object_solve(np.zeros(3), np.zeros(3), t_span=(t0, t0 + 10.), t_eval=t_eval,
+                            method="DOP853", backend=backend, **models)
+        for backend in ("numba", "solve_ivp")
+    ]
+    assert sols[0].success and sols[1].success
+    assert sols[0].nfev == sols[1].nfev
+    np.testing.assert_allclose(sols[0].y, sols[1].y, rtol=1e-12)
+
+
+def test_vectorized_solve():
+    """Test that vectorized evaluation of user callables reproduces the regular solve."""
+    models = dict(
+        potential_func=lambda pos: -pos / np.sum(pos**2, axis=0)**1.5,
+        feedback_func=lambda t, pos: np.array([0., 0., 0.01]),
+        feedback_params=None,
+    )
+    t_eval = np.linspace(0., 5., 10)
+    solves = [
+        single_object_solve(np.array([1., 0., 0.1]), np.array([0., 0.9, 0.]), t_span=(0., 5.), t_eval=t_eval,
+                            method="Radau", backend="solve_ivp", vectorized=vectorized, **models)
+        for vectorized in (False, True)
+    ]
+    np.testing.assert_allclose(solves[1].y, solves[0].y, atol=1e-8)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_multi_object_solve_matches_single(chunk_size):
+    """Test that the joint integration of several objects, in one or several groups, reproduces individual solves."""
+    t_eval = np.linspace(0., 5., 20)
+    initial_positions = np.array([[0., 0., 1.], [1., 0., 0.5], [0., -2., 0.]])
+    initial_velocities = np.array([[0., 0., 0.], [0., 1., 0.], [0.5, 0., 0.2]])
+    models = dict(
+        potential_func="squared_potential_force",
+        feedback_func="linear_feedback",
+        potential_params=dict(a_0=np.array([1., 2., 3.])),
+        feedback_params=dict(a_0=np.array([0., 0., -1.]), a_1=np.array([0.1, 0., 0.])),
+    )
+    sol = multi_object_solve(initial_positions, initial_velocities, t_span=(0., 5.), t_eval=t_eval, chunk_size=chunk_size, **models)
+    assert sol.y.shape == (3, 6, len(t_eval))
+    for i in range(3):
+        single = single_object_solve(initial_positions[i], initial_velocities[i], t_span=(0., 5.), t_eval=t_eval, **models)
+        np.testing.assert_allclose(sol.y[i], single.y, atol=1e-6)
+    for invalid in (0, -1):
+        with pytest.raises(ValueError, match="chunk_size"):
+            multi_object_solve(initial_positions, initial_velocities, t_span=(0., 5.), t_eval=t_eval, chunk_size=invalid, **models)
+
+
+def test_multi_object_solve_galpy():
+    """Test that galpy potentials are evaluated for all objects at once in the joint integration."""
+    t_eval = np.linspace(0., 2., 5)
+    initial_positions = np.array([[0., 0., 1.], [1., 0.5, 0.2]])
+    initial_velocities = np.array([[0., 0., 0.], [0., 1., 0.]])
+    models = dict(
+        potential_func="MiyamotoNagai",
+        feedback_func="constant_feedback",
+        feedback_params=dict(a_0=np.array([0., 0., 0.1])),
+    )
+    sol = multi_object_solve(initial_positions, initial_velocities, t_span=(0., 2.), t_eval=t_eval, **models)
+    for i in range(2):
+        single = single_object_solve(initial_positions[i], initial_velocities[i], t_span=(0., 2.), t_eval=t_eval, **models)
+        np.testing.assert_allclose(sol.y[i], single.y, atol=1e-6)
+
+
+@pytest.mark.parametrize("method, n_jobs", [(None, 2), (None, -2), ("LSODA", 2), ("LSODA", -2)])
+def test_multi_object_solve_parallel(method, n_jobs):
+    """Test that objects integrated in parallel threads or processes match individual solves."""
+    rng = np.random.default_rng(0)
+    initial_positions = rng.normal(size=(5, 3))
+    initial_velocities = 0.5 * rng.normal(size=(5, 3))
+    t_eval = np.linspace(0., 50., 20)
+    models = dict(
+        potential_func="squared_potential_force",
+        feedback_func="linear_feedback",
+        potential_params=dict(a_0=np.array([1., 2., 3.])),
+        feedback_params=dict(a_0=np.array([0., 0., -0.1]), a_1=np.array([0.01, 0., 0.])),
+    )
+    sol = multi_object_solve_parallel(initial_positions, initial_velocities, t_span=(0., 50.), t_eval=t_eval, method=method, n_jobs=n_jobs, **models)
+    assert sol.y.shape == (5, 6, len(t_eval))
+    for i in range(5):
+        single = single_object_solve(initial_positions[i], initial_velocities[i], t_span=(0., 50.), t_eval=t_eval,
+                                     method="DOP853", backend="solve_ivp", **models)
+        np.testing.assert_allclose(sol.y[i], single.y, atol=1e-5)
+    with pytest.raises(ValueError):
+        multi_object_solve_parallel(initial_positions, initial_velocities, t_span=(0., 50.), t_eval=t_eval, method=method, n_jobs=0, **models)
+
+
+def test_batch_solve():
+    """Test that batched solves in worker processes match individual solves."""
+    t_eval = np.linspace(0., 5., 10)
+    cases = [
+        dict(
+            initial_position=np.array([0., 0., z]),
+            initial_velocity=np.array([0., 0., 0.]),
+            t_span=(0., 5.),
+            t_eval=t_eval,
+            potential_func="squared_potential_force",
+            feedback_func="constant_feedback",
+            potential_params=dict(a_0=np.array([1., 1., 1.])),
+            feedback_params=dict(a_0=np.array([0., 0., -1.])),
+        )
+        for z in (0.5, 1., 2.)
+    ]
+    for case, sol in zip(cases, batch_solve(cases, n_jobs=2)):
+        np.testing.assert_allclose(sol.y, single_object_solve(**case).y)
+
+
+def test_warm_up():
+    """Test that warming up in the background compiles the models used by later solves."""
+    models = dict(
+        potential_func="squared_potential_force",
+        feedback_func="constant_feedback",
+        potential_params=dict(a_0=np.array([1., 1., 1.])),
+        feedback_params=dict(a_0=np.array([0., 0., -1.])),
+    )
+    thread = warm_up(background=True, **models)
+    thread.join()
+    assert warm_up(**models) is None
+    sol = single_object_solve(np.array([0., 0., 1.]), np.zeros(3), t_span=(0., 1.), t_eval=np.array([0., 1.]), **models)
+    assert sol.success
+
+
+def test_propagate_output_buffer():
+    """Test that the reference RHS writes into the given buffer and matches the allocating call."""
+    from ClusterChainDynamics.simulations.calculate_path import propagate
+    pos_and_vel = np.array([1., -2., 0.5, 0.1, 0.2, -0.3])
+    models = (lambda pos: -pos, lambda t, pos: np.array([0., 0., -t]))
+    out = np.empty(6)
+    assert propagate(2., pos_and_vel, *models, out=out) is out
+    np.testing.assert_allclose(out, [0.1, 0.2, -0.3, -1., 2., -2.5])
+    np.testing.assert_allclose(propagate(2., pos_and_vel, *models), out)
+
+
+def test_list_parameters():
+    """Test that parameters given as lists are accepted by the single and multi-object solvers alike."""
+    t_eval = np.linspace(0., 5., 20)
+    models = dict(
+        potential_func="squared_potential_force",
+        feedback_func="linear_feedback",
+        potential_params=dict(a_0=[1., 2., 3.]),
+        feedback_params=dict(a_0=[0., 0., -0.1], a_1=[0.01, 0., 0.]),
+    )
+    initial_positions = np.array([[0., 0., 1.], [1., 0., 0.5]])
+    initial_velocities = np.array([[0., 0., 0.], [0., 1., 0.]])
+    sol = multi_object_solve(initial_positions, initial_velocities, t_span=(0., 5.), t_eval=t_eval, **models)
+    for i in range(2):
+        single = single_object_solve(initial_positions[i], initial_velocities[i], t_span=(0., 5.), t_eval=t_eval, **models)
+        np.testing.assert_allclose(sol.y[i], single.y, atol=1e-6)
+
+
+def test_lsoda_jacobian_with_rhs_arguments():
+    """Test that LSODA on the ode backend calls the analytic Jacobian after switching to stiff mode."""
+    a_0 = np.array([1e4, 1., 1.])
+    calls = []
+
+    def potential(pos):
+        return -a_0 * pos
+
+    def potential_jacobian(pos):
+        calls.append(pos)
+        return -np.diag(a_0)
+
+    potential.jacobian = potential_jacobian
+    t_eval = np.linspace(0., 10., 20)
+    # The RHS receives its output buffer through f_params, which LSODA also passes to the Jacobian
+    sol = single_object_solve(np.array([1., 0., 0.]), np.array([0., 1., 0.]), t_span=(0., 10.), t_eval=t_eval,
+                              potential_func=potential, feedback_func="constant_feedback", feedback_params=dict(a_0=np.zeros(3)),
+                              method="LSODA", backend="ode", rtol=1e-6, atol=1e-8)
+    assert sol.success
+    assert calls
+    np.testing.assert_allclose(sol.y[1], np.sin(t_eval), atol=1e-4)
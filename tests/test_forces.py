@@ -0,0 +1,135 @@
+"""Test module for the force models in ClusterChainDynamics.forces."""
+
+import numpy as np
+import pytest
+
+from ClusterChainDynamics.forces import feedback, gravity
+from ClusterChainDynamics.forces.gravity.galpy_wrapper import _get_galpy_potential, _closed_form, _internal_units_methods, has_galpy
+from ClusterChainDynamics._numba import has_numba
+
+
+def test_pulsed_feedback():
+    """Test that pulses are Gaussians in time with the given peak acceleration and width."""
+    a_0 = np.array([[0., 1.], [0., 0.], [1., -2.]])
+    t_pulse = np.array([20., 50.])
+    sigma_t = np.array([10., 20.])
+    pos = np.zeros(3)
+
+    a_peak = feedback.pulsed_feedback(50., pos, a_0, t_pulse, sigma_t)
+    expected = a_0[:, 1] + a_0[:, 0] * np.exp(-0.5 * 3.**2)
+    np.testing.assert_allclose(a_peak, expected)
+
+    a_sigma = feedback.pulsed_feedback(70., pos, a_0, t_pulse, sigma_t)
+    expected = a_0[:, 1] * np.exp(-0.5) + a_0[:, 0] * np.exp(-0.5 * 5.**2)
+    np.testing.assert_allclose(a_sigma, expected)
+
+
+def test_windowed_pulsed_feedback():
+    """Test that the windowed pulse evaluation agrees with evaluating all pulses."""
+    rng = np.random.default_rng(42)
+    n_pulses = 50
+    params = feedback.sort_pulses(dict(
+        a_0=rng.normal(size=(3, n_pulses)),
+        t_pulse=rng.uniform(0., 1000., n_pulses),
+        sigma_t=rng.uniform(1., 10., n_pulses),
+    ))
+    pos = np.zeros(3)
+    for t in [-100., 0., 123.4, 500., 999., 2000.]:
+        np.testing.assert_allclose(
+            feedback.windowed_pulsed_feedback(t, pos, k_sigma=8., **params),
+            feedback.pulsed_feedback(t, pos, **params),
+            atol=1e-12,
+        )
+
+
+def test_axisymmetric_force():
+    """Test the Cartesian acceleration built from cylindrical forces against a point mass, for one and many positions."""
+    def Rzforce(R, z):
+        r3 = (R**2 + z**2)**1.5
+        return -R / r3, -z / r3
+    force = gravity.axisymmetric_force(Rzforce)
+    positions = np.array([[0.5, -0.3, 0.2], [0., 0., 0.4], [1., 2., -1.]]).T
+    expected = -positions / np.linalg.norm(positions, axis=0)**3
+    np.testing.assert_allclose(force(positions), expected)
+    for i in range(positions.shape[1]):
+        np.testing.assert_allclose(force(positions[:, i]), expected[:, i])
+
+
+@pytest.mark.skipif(not has_galpy, reason="galpy not installed")
+@pytest.mark.parametrize("potential_type", ["MiyamotoNagai", "NFWPotential", "HernquistPotential"])
+def test_galpy_jacobian(potential_type):
+    """Test the analytic Jacobian of galpy accelerations against central differences, on and off the axis."""
+    potential = _get_galpy_potential(potential_type)
+    h = 1e-6
+    for pos in [np.array([0.5, -0.3, 0.2]), np.array([0., 0., 0.4])]:
+        numeric = np.empty((3, 3))
+        for j in range(3):
+            step = np.zeros(3)
+            step[j] = h
+            numeric[:, j] = (potential(pos + step).copy() - potential(pos - step).copy()) / (2. * h)
+        np.testing.assert_allclose(potential.jacobian(pos), numeric, atol=1e-8)
+
+
+@pytest.mark.skipif(not has_galpy, reason="galpy not installed")
+@pytest.mark.parametrize("potential_type, force, jac, params", [
+    ("MiyamotoNagai", gravity.miyamoto_nagai_force, gravity.miyamoto_nagai_jac, dict(amp=1., a=1., b2=0.01)),
+    ("NFWPotential", gravity.nfw_force, gravity.nfw_jac, dict(amp=1., a=1.)),
+    ("HernquistPotential", gravity.hernquist_force, gravity.hernquist_jac, dict(amp=1., a=1.)),
+])
+def test_closed_form_potentials(potential_type, force, jac, params):
+    """Test the closed-form potential models and their Jacobians against galpy's default potentials."""
+    potential = _get_galpy_potential(potential_type)
+    positions = np.array([[0.5, -0.3, 0.2], [0., 0., 0.4], [1., 2., -1.]]).T
+    expected = np.stack([potential(positions[:, i]).copy() for i in range(positions.shape[1])], axis=1)
+    np.testing.assert_allclose(force(positions, **params), expected, rtol=1e-12)
+    for i in range(positions.shape[1]):
+        pos = np.ascontiguousarray(positions[:, i])
+        np.testing.assert_allclose(force(pos, **params), expected[:, i], rtol=1e-12)
+        np.testing.assert_allclose(jac(pos, **params), potential.jacobian(pos), rtol=1e-10, atol=1e-14)
+
+
+@pytest.mark.skipif(not (has_galpy and has_numba), reason="galpy or numba not installed")
+@pytest.mark.parametrize("potential_class, potential_type, kwargs", [
+    ("MiyamotoNagaiPotential", "MiyamotoNagai", dict(amp=2., a=1.5, b=0.3)),
+    ("NFWPotential", "NFWPotential", dict(amp=2., a=3.)),
+    ("HernquistPotential", "HernquistPotential", dict(amp=2., a=0.5)),
+])
+def test_closed_form_from_galpy(potential_class, potential_type, kwargs):
+    """Test that the closed form taken from a galpy instance reproduces galpy's public force methods."""
+    import galpy.potential
+    assert hasattr(_get_galpy_potential(potential_type), "closed_form")
+    potential = getattr(galpy.potential, potential_class)(**kwargs)
+    # Fails if the galpy attributes the parameters are read from change
+    func, params = _closed_form(potential, potential_type)
+    pos = np.array([0.3, -0.4, 0.7])
+    R = np.hypot(pos[0], pos[1])
+    expected = [potential.Rforce(R, pos[2]) * pos[0] / R, potential.Rforce(R, pos[2]) * pos[1] / R, potential.zforce(R, pos[2])]
+    np.testing.assert_allclose(func(pos, **params), expected, rtol=1e-12)
+    # Physical units are not covered by the closed forms
+    assert _closed_form(getattr(galpy.potential, potential_class)(ro=8., vo=220., **kwargs), potential_type) is None
+
+
+@pytest.mark.skipif(not has_galpy, reason="galpy not installed")
+@pytest.mark.parametrize("potential_class", ["MiyamotoNagaiPotential", "NFWPotential", "HernquistPotential"])
+def test_galpy_internal_units_methods(potential_class):
+    """Test that the shortcuts past galpy's unit handling match the public methods, and are refused otherwise."""
+    import galpy.potential
+    potential = getattr(galpy.potential, potential_class)(amp=2.)
+    # Fails if the galpy private members the shortcuts are built from change
+    methods = _internal_units_methods(potential)
+    for method, name in zip(methods, ("Rforce", "zforce", "R2deriv", "z2deriv", "Rzderiv")):
+        assert method(0.7, -0.2) == pytest.approx(getattr(potential, name)(0.7, -0.2), rel=1e-12)
+    assert _internal_units_methods(getattr(galpy.potential, potential_class)(ro=8., vo=220.)) is None
+    del potential._amp
+    assert _internal_units_methods(potential) is None
+
+
+@pytest.mark.parametrize("force, params", [
+    (gravity.miyamoto_nagai_force, dict(amp=1., a=1., b2=0.01)),
+    (gravity.nfw_force, dict(amp=1., a=1.)),
+    (gravity.hernquist_force, dict(amp=1., a=1.)),
+])
+def test_closed_form_potentials_at_center(force, params):
+    """Test that the closed-form forces stay finite at the center, for one and many positions."""
+    assert np.all(np.isfinite(force(np.zeros(3), **params)))
+    assert np.all(np.isfinite(force(np.zeros((3, 2)), **params)))
@@ -0,0 +1,54 @@
+"""Test module for the observation of integrated trajectories in ClusterChainDynamics.simulations."""
+
+import numpy as np
+import pytest
+
+from ClusterChainDynamics import single_object_solve, observe_single_object
+
+
+def test_observe_single_object():
+    """Test noiseless observations against the analytic orbit and the spread of the added noise."""
+    sol = single_object_solve(
+        initial_position=np.array([0., 0., 1.]),
+        initial_velocity=np.array([0., 0., 0.]),
+        t_span=(0., 10.),
+        t_eval=np.linspace(0., 10., 2001),
+        potential_func="squared_potential_force",
+        feedback_func="constant_feedback",
+        potential_params=dict(a_0=np.array([0., 0., 1.])),
+        feedback_params=dict(a_0=-np.array([0., 0., 1.])),
+    )
+    times = np.array([0.5, 3.3, 7.1])
+
+    observation = observe_single_object(sol, times, noise_std=0., positional_response=lambda pos: pos[2])
+    np.testing.assert_allclose(observation["positions"], [-1. + 2. * np.cos(times)], atol=1e-5)
+    np.testing.assert_allclose(observation["velocities"][2], -2. * np.sin(times), atol=1e-5)
+
+    times = np.linspace(1., 9., 20000)
+    noise_std = np.array([0.1, 0.2, 0.3, 0.01, 0.02, 0.03])
+    observation = observe_single_object(sol, times, noise_std, rng=np.random.default_rng(0))
+    noiseless = observe_single_object(sol, times, 0.)
+    residuals = np.concatenate((observation["positions"], observation["velocities"])) - np.concatenate((noiseless["positions"], noiseless["velocities"]))
+    np.testing.assert_allclose(residuals.std(axis=1), noise_std, rtol=0.05)
+
+
+def test_observe_outside_solution():
+    """Test that observation times outside the stored solution are rejected, with and without dense output."""
+    t_eval = np.linspace(0., 10., 101)
+    for dense_output in (False, True):
+        sol = single_object_solve(
+            initial_position=np.array([0., 0., 1.]),
+            initial_velocity=np.array([0., 0., 0.]),
+            t_span=(0., 10.),
+            t_eval=t_eval,
+            potential_func="squared_potential_force",
+            feedback_func="constant_feedback",
+            potential_params=dict(a_0=np.array([1., 1., 1.])),
+            feedback_params=dict(a_0=np.zeros(3)),
+            backend="solve_ivp",
+            dense_output=dense_output,
+        )
+        for times in (np.array([-0.5, 1.]), np.array([5., 10.5])):
+            with pytest.raises(ValueError):
+                observe_single_object(sol, times, noise_std=0.)
+        observe_single_object(sol, np.array([0., 10.]), noise_std=0.)